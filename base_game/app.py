@@ -1,34 +1,109 @@
+import pygame
+
+from .systems.render import frozen_frame
+from .systems.trace import tracer
+
+
 class SceneManager:
     def __init__(self):
         self._scenes = {}
-        self.current = None
+        self._backdrops = []
+        self._prepared = set()
+        self.stack = []
+
+    @property
+    def current(self):
+        return self.stack[-1] if self.stack else None
+
+    @property
+    def backdrop(self):
+        return self._backdrops[-1] if self._backdrops else None
 
     def register(self, name, scene):
         scene._manager = self
         self._scenes[name] = scene
 
+    def below(self, scene):
+        for i in range(len(self.stack) - 1, 0, -1):
+            if self.stack[i] is scene:
+                return self.stack[i - 1]
+        return None
+
+    def prepare(self, name):
+        if name in self._prepared:
+            return
+        self._prepared.add(name)
+        scene = self._scenes[name]
+        if hasattr(scene, "prepare"):
+            with tracer.span("SceneManager.prepare"):
+                scene.prepare()
+
+    def push(self, name, *args, **kwargs):
+        scene = self._scenes[name]
+        self._backdrops.append(self._capture_backdrop(scene))
+        self.stack.append(scene)
+        self._enter(name, scene, *args, **kwargs)
+
+    def pop(self, *args, **kwargs):
+        if not self.stack:
+            return None
+        scene = self.stack.pop()
+        self._backdrops.pop()
+        if hasattr(scene, "on_exit"):
+            scene.on_exit()
+        top = self.current
+        if top is not None:
+            tracer.instant("SceneManager.resume", scene=type(top).__name__)
+            if hasattr(top, "invalidate"):
+                top.invalidate()
+            if hasattr(top, "on_resume"):
+                top.on_resume(*args, **kwargs)
+        return scene
+
     def change(self, name, *args, **kwargs):
-        if self.current and hasattr(self.current, "on_exit"):
-            self.current.on_exit()
+        scene = self._scenes[name]
+        backdrop = self._capture_backdrop(scene)
+        while self.stack:
+            old = self.stack.pop()
+            if hasattr(old, "on_exit"):
+                old.on_exit()
+        self._backdrops = [backdrop]
+        self.stack.append(scene)
+        self._enter(name, scene, *args, **kwargs)
 
-        same_scene = self.current is self._scenes.get(name)
-        self.current = self._scenes[name]
-        self.current._manager = self
+    def _enter(self, name, scene, *args, **kwargs):
+        tracer.instant("SceneManager.enter", scene=name)
+        scene._manager = self
+        self.prepare(name)
+        if hasattr(scene, "invalidate"):
+            scene.invalidate()
+        if hasattr(scene, "on_enter"):
+            scene.on_enter(*args, **kwargs)
+        for nxt in getattr(scene, "NEXT_SCENES", ()):
+            self.prepare(nxt)
 
-        if kwargs.pop("resume", False) and hasattr(self.current, "on_resume"):
-            self.current.on_resume(*args, **kwargs)
-        elif same_scene and hasattr(self.current, "on_resume"):
-            self.current.on_resume(*args, **kwargs)
-        elif hasattr(self.current, "on_enter"):
-            self.current.on_enter(*args, **kwargs)
+    def _capture_backdrop(self, scene):
+        spec = getattr(scene, "BACKDROP", None)
+        surface = pygame.display.get_surface()
+        if spec is None or self.current is None or surface is None:
+            return None
+        with tracer.span("SceneManager.backdrop"):
+            if hasattr(self.current, "snapshot"):
+                surface = self.current.snapshot(surface)
+            return frozen_frame(surface, **spec)
 
     def update(self, dt, ctx):
         if self.current and hasattr(self.current, "update"):
-            self.current.update(dt, ctx)
+            with tracer.span("SceneManager.update"):
+                self.current.update(dt, ctx)
 
     def draw(self, ctx):
         if self.current and hasattr(self.current, "draw"):
-            self.current.draw(ctx)
+            with tracer.span("SceneManager.draw"):
+                if hasattr(self.current, "render"):
+                    self.current.render(ctx)
+                else:
+                    self.current.draw(ctx)
 
     def on_key_down(self, key, ctx):
         if self.current and hasattr(self.current, "on_key_down"):
@@ -41,3 +116,27 @@ class SceneManager:
     def on_mouse_down(self, pos, button, ctx):
         if self.current and hasattr(self.current, "on_mouse_down"):
             self.current.on_mouse_down(pos, button, ctx)
+
+    def on_mouse_up(self, pos, button, ctx):
+        if self.current and hasattr(self.current, "on_mouse_up"):
+            self.current.on_mouse_up(pos, button, ctx)
+
+    def on_mouse_move(self, pos, ctx):
+        if self.current and hasattr(self.current, "on_mouse_move"):
+            self.current.on_mouse_move(pos, ctx)
+
+
+def build_manager():
+    from .scenes.game_over import GameOverScene
+    from .scenes.menu import MenuScene
+    from .scenes.pause import PauseScene
+    from .scenes.play import PlayScene
+    from .scenes.you_win import YouWinScene
+
+    manager = SceneManager()
+    manager.register("menu", MenuScene())
+    manager.register("play", PlayScene())
+    manager.register("pause", PauseScene())
+    manager.register("game_over", GameOverScene())
+    manager.register("you_win", YouWinScene())
+    return manager
@@ -1,3 +1,6 @@
 WIDTH, HEIGHT = 960, 540
 TITLE = "Marcel`s Game"
 FPS = 60
+
+TRACE_SECONDS = 5.0
+TRACE_DIR = "traces"
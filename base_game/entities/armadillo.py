@@ -1,15 +1,20 @@
-import math, random
+import math
 from pygame import Rect
 from .enemy import Enemy, _hit_wall, _hit_obstacle
-from ..utils.animation import Animation
+from ..systems.assets import assets
+from ..systems.events import HIT_PLAYER
+from ..systems.timers import timers
+from ..utils.animation import Animation, clip
 
 class _NoDirAnim:
     def __init__(self, anim: Animation):
         self.anim = anim
     def set_dir(self, _): 
         pass
-    def update(self, dt, playing=True):
-        self.anim.update(dt, playing)
+    def set_playing(self, playing):
+        self.anim.set_playing(playing)
+    def reset(self):
+        self.anim.reset()
     def get(self):
         return self.anim.get()
 
@@ -22,65 +27,66 @@ class ArmadilloEnemy(Enemy):
     CONTACT_DAMAGE = 1
     CONTACT_COOLDOWN = 0.35
 
-    def __init__(self, x, y):
-        super().__init__(x, y, w=22, h=22, max_hp=10, speed=self.ROLL_SPEED, counts_for_clear=True)
+    _CLIPS = None
 
-        windup_names = [f"enemies/armadillo/arm_roll_{i}" for i in range(0, 4)]
-        roll_names   = [f"enemies/armadillo/arm_roll_{i}" for i in range(4, 8)]
+    def __init__(self, x, y, rng=None):
+        super().__init__(
+            x, y, w=22, h=22, max_hp=10, speed=self.ROLL_SPEED, counts_for_clear=True, rng=rng
+        )
 
-        idle_names = [f"enemies/armadillo/arm_idle_{i}" for i in range(8)]
+        clips = self.clips()
+        self.anim_windup = _NoDirAnim(Animation(clips["windup"]))
+        self.anim_roll   = _NoDirAnim(Animation(clips["roll"]))
+        self.anim_idle   = _NoDirAnim(Animation(clips["idle"])) if clips["idle"] else None
 
-        self.anim_windup = _NoDirAnim(Animation(windup_names, fps=12))   
-        self.anim_roll   = _NoDirAnim(Animation(roll_names,   fps=14))   
-        self.anim_idle   = None
-        try:
-
-            self.anim_idle = _NoDirAnim(Animation(idle_names, fps=6))
-        except Exception:
-            self.anim_idle = None
-
-        fallback_idle = _NoDirAnim(Animation([windup_names[0]], fps=1))
+        fallback_idle = _NoDirAnim(Animation(clips["fallback"]))
         self.anim = self.anim_idle or fallback_idle
 
         self.state = "REST"                 
-        self._state_t = random.uniform(0.2, 0.6) 
-        self._contact_cd = 0.0
+        self._state_t = self.timer(self.rng.uniform(0.2, 0.6))
+        self._contact_cd = self.timer()
 
         self._dirx, self._diry = self._random_dir()
 
+    @classmethod
+    def clips(cls):
+        if cls._CLIPS is None:
+            roll_names = assets.frame_names("enemies/armadillo/arm_roll")
+            idle_names = assets.frame_names("enemies/armadillo/arm_idle")
+            windup_names = roll_names[:4]
+            cls._CLIPS = {
+                "windup": clip(windup_names, fps=12),
+                "roll": clip(roll_names[4:], fps=14),
+                "idle": clip(idle_names, fps=6) if idle_names else None,
+                "fallback": clip(windup_names[:1], fps=1),
+            }
+        return cls._CLIPS
+
     def _random_dir(self):
-        ang = random.uniform(0.0, math.tau)
+        ang = self.rng.uniform(0.0, math.tau)
         return math.cos(ang), math.sin(ang)
 
     def _set_anim(self, which):
         if self.anim is which:  
             return
         self.anim = which
-        try:
-            self.anim.anim.i = 0
-            self.anim.anim.t = 0.0
-        except Exception:
-            pass
-
-    def sense(self, dt, room, player_rect):
-        self._contact_cd = max(0.0, self._contact_cd - dt)
+        self.anim.reset()
 
     def think(self, dt, room, player_rect):
-        self._state_t -= dt
 
         if self.state == "REST":
             self._vx = self._vy = 0.0
             self._set_anim(self.anim_idle or self.anim_windup)  
-            if self._state_t <= 0.0:
+            if timers.ready(self._state_t):
                 self.state = "WINDUP"
-                self._state_t = self.WINDUP_TIME
+                timers.start(self._state_t, self.WINDUP_TIME)
                 self._set_anim(self.anim_windup)
 
         elif self.state == "WINDUP":
             self._vx = self._vy = 0.0
-            if self._state_t <= 0.0:
+            if timers.ready(self._state_t):
                 self.state = "ROLL"
-                self._state_t = self.ROLL_TIME
+                timers.start(self._state_t, self.ROLL_TIME)
                 dx = player_rect.centerx - self.rect.centerx
                 dy = player_rect.centery - self.rect.centery
                 L = math.hypot(dx, dy)
@@ -88,7 +94,7 @@ class ArmadilloEnemy(Enemy):
                     self._dirx, self._diry = self._random_dir()
                 else:
                     nx, ny = dx / L, dy / L
-                    jitter = random.uniform(-0.35, 0.35)
+                    jitter = self.rng.uniform(-0.35, 0.35)
                     ca, sa = math.cos(jitter), math.sin(jitter)
                     self._dirx = nx * ca - ny * sa
                     self._diry = ny * ca + nx * sa
@@ -99,9 +105,9 @@ class ArmadilloEnemy(Enemy):
         elif self.state == "ROLL":
             self._vx = self._dirx * self.ROLL_SPEED
             self._vy = self._diry * self.ROLL_SPEED
-            if self._state_t <= 0.0:
+            if timers.ready(self._state_t):
                 self.state = "REST"
-                self._state_t = self.REST_TIME
+                timers.start(self._state_t, self.REST_TIME)
                 self._set_anim(self.anim_idle or self.anim_windup)
 
     def move(self, dt, room):
@@ -131,7 +137,7 @@ class ArmadilloEnemy(Enemy):
                 bounced = True
 
         if bounced:
-            ang = math.atan2(self._diry, self._dirx) + random.uniform(-0.25, 0.25)
+            ang = math.atan2(self._diry, self._dirx) + self.rng.uniform(-0.25, 0.25)
             self._dirx, self._diry = math.cos(ang), math.sin(ang)
 
         if abs(self._vx) > abs(self._vy):
@@ -139,12 +145,11 @@ class ArmadilloEnemy(Enemy):
         elif abs(self._vy) > 0:
             self.last_dir = "down" if self._vy > 0 else "up"
 
-    def act(self, dt, room, player_rect):
-        if self.state == "ROLL" and self._contact_cd <= 0.0:
+    def act(self, dt, room, player_rect, events):
+        if self.state == "ROLL" and timers.ready(self._contact_cd):
             if self.rect.colliderect(player_rect):
-                self._contact_cd = self.CONTACT_COOLDOWN
-                return ("HIT_PLAYER", self.CONTACT_DAMAGE)
-        return None
+                timers.start(self._contact_cd, self.CONTACT_COOLDOWN)
+                events.push(HIT_PLAYER, self.CONTACT_DAMAGE)
 
     def draw(self, ctx, cam_x, cam_y):
         super().draw(ctx, cam_x, cam_y)
@@ -1,6 +1,9 @@
+import random
+
 from pygame import Rect
 
 from ..level import tiles
+from ..systems.timers import timers
 
 
 def _tile_size():
@@ -28,8 +31,11 @@ def _hit_obstacle(room, x, y, w, h):
 
 
 class Enemy:
-    def __init__(self, x, y, w=24, h=24, max_hp=5, speed=100, counts_for_clear=True):
+    def __init__(
+        self, x, y, w=24, h=24, max_hp=5, speed=100, counts_for_clear=True, rng=None
+    ):
         self.rect = Rect(x, y, w, h)
+        self.rng = random if rng is None else rng
         self.max_hp = max_hp
         self.hp = max_hp
         self.alive = True
@@ -42,6 +48,17 @@ class Enemy:
         self._vx = 0.0
         self._vy = 0.0
         self.pushable = True
+        self._timers = []
+
+    def timer(self, duration=0.0):
+        handle = timers.new(duration)
+        self._timers.append(handle)
+        return handle
+
+    def release(self):
+        for handle in self._timers:
+            timers.free(handle)
+        self._timers.clear()
 
     def take_damage(self, dmg=1):
         if not self.alive:
@@ -80,28 +97,26 @@ class Enemy:
         elif abs(self._vy) > 0:
             self.last_dir = "down" if self._vy > 0 else "up"
 
-    def act(self, dt, room, player_rect):
-        return None
+    def act(self, dt, room, player_rect, events):
+        pass
 
     def post_update(self, dt, room):
         pass
 
-    def update(self, dt, room, player_rect):
+    def update(self, dt, room, player_rect, events):
         if not self.alive:
-            return None
+            return
 
         self.sense(dt, room, player_rect)
         self.think(dt, room, player_rect)
         self.move(dt, room)
-        evt = self.act(dt, room, player_rect)
+        self.act(dt, room, player_rect, events)
         self.post_update(dt, room)
 
         if self.anim:
             moving = (abs(self._vx) + abs(self._vy)) > 1e-3
             self.anim.set_dir(self.last_dir)
-            self.anim.update(dt, moving)
-
-        return evt
+            self.anim.set_playing(moving)
 
     def _draw_hp_bar(self, ctx, cam_x, cam_y, color=(200, 50, 50)):
         bw = self.rect.w
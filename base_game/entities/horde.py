@@ -0,0 +1,121 @@
+import random
+
+from ..systems import ecs
+from ..systems.depth import settle
+from ..systems.timers import timers
+from .armadillo import ArmadilloEnemy
+from .skeleton import SkeletonEnemy
+
+
+class Horde:
+    SKELETON_HP = 2
+    ARMADILLO_HP = 3
+    SEPARATION = 20
+    WALK_FPS = 10
+    ROLL_FPS = 14
+
+    def __init__(self, rng=None):
+        self.store = ecs.EnemyStore()
+        self.rng = random if rng is None else rng
+        self._frames = None
+        self._order = None
+
+    def __len__(self):
+        return self.store.count
+
+    def spawn_skeleton(self, x, y):
+        self._order = None
+        return self.store.spawn(ecs.KIND_SKELETON, x, y, 24, 24, self.SKELETON_HP, 110.0)
+
+    def spawn_armadillo(self, x, y):
+        self._order = None
+        return self.store.spawn(
+            ecs.KIND_ARMADILLO, x, y, 22, 22, self.ARMADILLO_HP, ArmadilloEnemy.ROLL_SPEED,
+            state=ecs.STATE_REST, timer=self.rng.uniform(0.2, 0.6),
+        )
+
+    def clear(self):
+        self._order = None
+        self.store.clear()
+
+    def update(self, dt, room, player_rect, events, blockers=()):
+        store = self.store
+        if not store.count:
+            return
+        ecs.decay_cooldowns(store, dt)
+        ecs.steer(
+            store, player_rect, self.rng,
+            ArmadilloEnemy.ROLL_SPEED, ArmadilloEnemy.REST_TIME, ArmadilloEnemy.ROLL_TIME,
+        )
+        ecs.separate(store, self.SEPARATION)
+        ecs.integrate(store, dt, room, blockers)
+        ecs.contact_damage(
+            store, player_rect, events, 1,
+            (SkeletonEnemy.ATTACK_COOLDOWN, ArmadilloEnemy.CONTACT_COOLDOWN),
+        )
+
+    def hit(self, rect, dmg):
+        i = self.store.hit_test(rect)
+        if i < 0:
+            return False
+        self.store.take_damage(i, dmg)
+        return True
+
+    def compact(self):
+        if self.store.compact():
+            self._order = None
+
+    def _load_frames(self):
+        walk = SkeletonEnemy.clips()["walk"]
+        arm = ArmadilloEnemy.clips()
+        self._frames = {
+            ecs.KIND_SKELETON: {d: c.frames for d, c in walk.items()},
+            ecs.KIND_ARMADILLO: {
+                ecs.STATE_ROLL: arm["roll"].frames,
+                ecs.STATE_REST: (arm["idle"] or arm["fallback"]).frames,
+            },
+        }
+
+    def draw(self, ctx, cam_x, cam_y):
+        store = self.store
+        if not store.count:
+            return 0
+        if self._frames is None:
+            self._load_frames()
+        skel, arm = self._frames[ecs.KIND_SKELETON], self._frames[ecs.KIND_ARMADILLO]
+        target = ctx.screen
+        sw, sh = target.width, target.height
+        x, y, w, h, vx, vy = store.x, store.y, store.w, store.h, store.vx, store.vy
+        kind, state = store.kind, store.state
+        blit = target.blit
+        now = timers.now
+        drawn = 0
+
+        def bottom(i):
+            return int(y[i]) + h[i]
+
+        order = self._order
+        if order is None:
+            order = self._order = sorted(range(store.count), key=bottom)
+        else:
+            settle(order, bottom)
+
+        for i in order:
+            cx = int(x[i]) + w[i] // 2 - cam_x
+            by = int(y[i]) + h[i] - cam_y
+            if cx < -48 or cx > sw + 48 or by < 0 or by > sh + 64:
+                continue
+            drawn += 1
+            target.depth = by + cam_y
+            phase = now + i * 0.137
+            if kind[i] == ecs.KIND_SKELETON:
+                if abs(vx[i]) > abs(vy[i]):
+                    frames = skel["right" if vx[i] > 0 else "left"]
+                else:
+                    frames = skel["down" if vy[i] >= 0 else "up"]
+                img = frames[int(phase * self.WALK_FPS) % len(frames)]
+            else:
+                frames = arm[ecs.STATE_ROLL if state[i] == ecs.STATE_ROLL else ecs.STATE_REST]
+                img = frames[int(phase * self.ROLL_FPS) % len(frames)]
+            blit(img, (cx - img.get_width() // 2, by - img.get_height()))
+        return drawn
@@ -1,7 +1,10 @@
 from pygame import Rect
 from .enemy import Enemy
-from ..utils.animation import Animation, DirectionalAnimation
+from ..utils.animation import DirectionalAnimation, clip
 from ..entities.projectile import Projectile
+from ..systems import sprites
+from ..systems.events import HIT_PLAYER, SPAWN_PROJECTILE
+from ..systems.timers import timers
 
 class PlantEnemy(Enemy):
     SPIT_COOLDOWN = 1.25
@@ -13,36 +16,40 @@ class PlantEnemy(Enemy):
     CONTACT_DAMAGE   = 1        
     CONTACT_COOLDOWN = 0.40    
 
-    def __init__(self, x, y, facing="down"):
-        super().__init__(x, y, w=24, h=24, max_hp=6, speed=0, counts_for_clear=True)
+    _CLIPS = None
+
+    def __init__(self, x, y, facing="down", rng=None):
+        super().__init__(x, y, w=24, h=24, max_hp=6, speed=0, counts_for_clear=True, rng=rng)
         self.facing = facing
         self.last_dir = facing
-        self._spit_cd = 0.0
+        self._spit_cd = self.timer()
         self._shoot_gate = False
         self._want_shoot = False
         self.pushable = False
-        self._touch_cd = 0.0     
+        self._touch_cd = self.timer()
         self._seq_playing = False   
         self._shot_this_seq = False     
-        self._prev_i = 0
-
-        def frames_dir(dir_name):
-            return [f"plant/plant_{i}_{dir_name}" for i in range(1, 9)]
-
-        self.anim_idle = DirectionalAnimation({
-            "down":  Animation(frames_dir("up"),  fps=8),
-            "left":  Animation(frames_dir("right"),  fps=8),
-            "up":    Animation(frames_dir("down"),    fps=8),
-            "right": Animation(frames_dir("left"), fps=8),
-        }, default_dir=facing)
-        a0 = self.anim_idle.anims[self.facing]
 
+        self.anim_idle = DirectionalAnimation(self.clips(), default_dir=facing)
+        self.anim_idle.hold(0)
         self.anim = self.anim_idle
-        self._frames_count = len(getattr(a0, "frames", [])) or 8
+        self._frames_count = self.anim_idle.frame_count() or 8
+
+    @classmethod
+    def clips(cls):
+        if cls._CLIPS is None:
+            def frames_dir(dir_name):
+                return clip([f"plant/plant_{i}_{dir_name}" for i in range(1, 9)], fps=8)
+
+            cls._CLIPS = {
+                "down": frames_dir("up"),
+                "left": frames_dir("right"),
+                "up": frames_dir("down"),
+                "right": frames_dir("left"),
+            }
+        return cls._CLIPS
 
     def sense(self, dt, room, player_rect):
-        self._spit_cd = max(0.0, self._spit_cd - dt)
-        self._touch_cd = max(0.0, self._touch_cd - dt)   
         self._vx = 0.0
         self._vy = 0.0
         self.last_dir = self.facing
@@ -51,68 +58,47 @@ class PlantEnemy(Enemy):
     def _make_seed(self):
         if self.facing == "down":
             vx, vy = 0.0,  self.BULLET_SPEED
-            sprite = "plant/projectiles/seed_projectile_down"
         elif self.facing == "up":
             vx, vy = 0.0, -self.BULLET_SPEED
-            sprite = "plant/projectiles/seed_projectile_up"
         elif self.facing == "left":
             vx, vy = -self.BULLET_SPEED, 0.0
-            sprite = "plant/projectiles/seed_projectile_left"
         else:
             vx, vy =  self.BULLET_SPEED, 0.0
-            sprite = "plant/projectiles/seed_projectile_right"
 
         cx, cy = self.rect.centerx, self.rect.centery
-        p = Projectile(cx, cy, w=8, h=8, vx=vx, vy=vy, ttl=self.BULLET_TTL, dmg=self.BULLET_DMG)
-        p.team = "enemy"   
-        p.sprite = sprite   
-        p.owner = "plant"   
-        return p
+        return Projectile(
+            cx, cy, w=8, h=8, vx=vx, vy=vy, ttl=self.BULLET_TTL, dmg=self.BULLET_DMG,
+            team="enemy", sprite=sprites.SEED, owner="plant",
+        )
 
-    def update(self, dt, room, player_rect):
+    def update(self, dt, room, player_rect, events):
             if not self.alive:
-                return None
+                return
 
             self.sense(dt, room, player_rect)
 
             self.anim.set_dir(self.facing)
-            a = self.anim_idle.anims[self.facing]
+            a = self.anim_idle
 
-            if self._touch_cd <= 0.0 and self.rect.colliderect(player_rect):
-                self._touch_cd = self.CONTACT_COOLDOWN
-                return ("HIT_PLAYER", self.CONTACT_DAMAGE)
+            if timers.ready(self._touch_cd) and self.rect.colliderect(player_rect):
+                timers.start(self._touch_cd, self.CONTACT_COOLDOWN)
+                events.push(HIT_PLAYER, self.CONTACT_DAMAGE)
+                return
             
             if not self._seq_playing:
-                try:
-                    a.i = 0
-                    a.t = 0.0
-                except Exception:
-                    pass
-
-                if self._spit_cd <= 0.0:
+                if timers.ready(self._spit_cd):
                     self._seq_playing = True
                     self._shot_this_seq = False
-                    self._prev_i = 0
-                return None  
+                    a.reset()
+                return
 
-            prev_i = int(getattr(a, "i", 0))
-            self.anim.update(dt, True)
-            cur_i = int(getattr(a, "i", prev_i))
+            frame = a.frame()
 
-            evt = None
-            if (not self._shot_this_seq) and (cur_i == self.SPIT_FRAME) and (cur_i != prev_i):
-                evt = ("SPAWN_ENEMY_PROJECTILE", self._make_seed())
+            if (not self._shot_this_seq) and frame >= self.SPIT_FRAME:
+                events.push(SPAWN_PROJECTILE, ref=self._make_seed())
                 self._shot_this_seq = True
 
-            last_ix = self._frames_count - 1
-            if (cur_i == last_ix) and (cur_i != prev_i):
+            if frame >= self._frames_count - 1:
                 self._seq_playing = False
-                self._spit_cd = self.SPIT_COOLDOWN
-                try:
-                    a.i = 0
-                    a.t = 0.0
-                except Exception:
-                    pass
-
-            self._prev_i = cur_i
-            return evt
\ No newline at end of file
+                timers.start(self._spit_cd, self.SPIT_COOLDOWN)
+                a.hold(0)
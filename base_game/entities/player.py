@@ -2,11 +2,13 @@ import os
 from math import sqrt
 
 from pgzero import loaders
-from pgzero.loaders import images as pgz_images
 from pygame import Rect
 
 from ..entities.projectile import Projectile
 from ..level import tiles
+from ..systems import sprites
+from ..systems.assets import assets
+from ..systems.timers import timers
 
 try:
     from pgzero.loaders import sounds as pgz_sounds
@@ -18,7 +20,6 @@ loaders.set_root(os.path.dirname(__file__))
 
 class Player:
     BULLET_SPEED = 300.0
-    WALK_FRAMES = 9
 
     def __init__(self, spawn_x, spawn_y, size=28, speed=160.0):
         self.rect = Rect(
@@ -27,64 +28,43 @@ class Player:
         self.speed = speed
 
         self.fire_cooldown = 0.15
-        self.fire_timer = 0.0
+        self.fire_timer = timers.new()
         self._hurt_snd = None
 
-        def _load_dir(base, n):
-            return [pgz_images.load(f"{base}_{i}") for i in range(n)]
-
-        frames_count = self.WALK_FRAMES
-
-        self.anim_walk = {
-            "UP": _load_dir("player/hero_walk_down", frames_count),
-            "LEFT": _load_dir("player/hero_walk_left", frames_count),
-            "DOWN": _load_dir("player/hero_walk_right", frames_count),
-            "RIGHT": _load_dir("player/hero_walk_up", frames_count),
-        }
-        self.facing = "DOWN"
-        self.anim_ix = 0
-        self.anim_t = 0.0
-        self.anim_speed = 0.10
-
-        def _load_idle_try(base_prefix, fallback_frames):
-            frames = []
-            i = 0
-            while True:
-                name = f"{base_prefix}_{i}"
-                try:
-                    frames.append(pgz_images.load(name))
-                    i += 1
-                except Exception:
-                    break
-            if not frames:
-                frames = [fallback_frames[0]]
-            return frames
-
-        self.anim_idle = {
-            "UP": _load_idle_try("player/hero_idle_down", self.anim_walk["UP"]),
-            "LEFT": _load_idle_try("player/hero_idle_left", self.anim_walk["LEFT"]),
-            "DOWN": _load_idle_try("player/hero_idle_right", self.anim_walk["DOWN"]),
-            "RIGHT": _load_idle_try("player/hero_idle_up", self.anim_walk["RIGHT"]),
-        }
+        self._load_frames()
 
         self.facing = "DOWN"
         self.is_moving = False
+        self.anim_start = timers.now
 
-        self.walk_ix = 0
-        self.walk_t = 0.0
         self.walk_speed = 0.10
-
-        self.idle_ix = 0
-        self.idle_t = 0.0
         self.idle_speed = 0.25
         self.max_hp = 6
         self.hp = self.max_hp
 
         self.invuln_time = 0.60
-        self.invuln = 0.0
+        self.invuln = timers.new()
 
         self.sfx_muted = False
 
+    def _load_frames(self):
+        def _load_dir(base):
+            return [assets.image(name) for name in assets.frame_names(base)]
+
+        self.anim_walk = {
+            "UP": _load_dir("player/hero_walk_down"),
+            "LEFT": _load_dir("player/hero_walk_left"),
+            "DOWN": _load_dir("player/hero_walk_right"),
+            "RIGHT": _load_dir("player/hero_walk_up"),
+        }
+
+        self.anim_idle = {
+            "UP": _load_dir("player/hero_idle_down") or self.anim_walk["UP"][:1],
+            "LEFT": _load_dir("player/hero_idle_left") or self.anim_walk["LEFT"][:1],
+            "DOWN": _load_dir("player/hero_idle_right") or self.anim_walk["DOWN"][:1],
+            "RIGHT": _load_dir("player/hero_idle_up") or self.anim_walk["RIGHT"][:1],
+        }
+
     def _move_and_collide(self, dx, dy, solid_at, hits_blocker):
         ts = tiles.TILE
         r = self.rect
@@ -130,13 +110,9 @@ class Player:
                     r.top = max(r.top, br.bottom)
 
     def update(self, dt, input_vec, solid_at, hits_blocker):
-        self.invuln = max(0.0, self.invuln - dt)
-
         dx, dy = input_vec
         self._move_and_collide(dx, dy, solid_at, hits_blocker)
 
-        self.fire_timer = max(0.0, self.fire_timer - dt)
-
         if abs(dx) > abs(dy):
             if dx > 0:
                 self.facing = "RIGHT"
@@ -148,32 +124,19 @@ class Player:
             elif dy < 0:
                 self.facing = "UP"
 
-        self.is_moving = dx != 0 or dy != 0
-
-        if self.is_moving:
-            self.walk_t += dt
-            if self.walk_t >= self.walk_speed:
-                self.walk_t = 0.0
-                self.walk_ix = (self.walk_ix + 1) % len(self.anim_walk[self.facing])
-            self.idle_t = 0.0
-            self.idle_ix = 0
-        else:
-            self.idle_t += dt
-            if self.idle_t >= self.idle_speed:
-                self.idle_t = 0.0
-                self.idle_ix = (self.idle_ix + 1) % len(self.anim_idle[self.facing])
-            self.walk_ix = 0
-            self.walk_t = 0.0
+        moving = dx != 0 or dy != 0
+        if moving != self.is_moving:
+            self.is_moving = moving
+            self.anim_start = timers.now
 
     def draw(self, ctx, cam_x, cam_y):
         if self.is_moving:
             frames = self.anim_walk[self.facing]
-            ix = min(self.walk_ix, len(frames) - 1)
-            frame = frames[ix]
+            step = self.walk_speed
         else:
             frames = self.anim_idle[self.facing]
-            ix = min(self.idle_ix, len(frames) - 1)
-            frame = frames[ix]
+            step = self.idle_speed
+        frame = frames[int((timers.now - self.anim_start) / step) % len(frames)]
 
         draw_x = self.rect.centerx - frame.get_width() // 2 - cam_x
         draw_y = self.rect.bottom - frame.get_height() - cam_y
@@ -181,7 +144,7 @@ class Player:
 
     def try_shoot(self, dir_x, dir_y):
 
-        if (dir_x == 0 and dir_y == 0) or self.fire_timer > 0.0:
+        if (dir_x == 0 and dir_y == 0) or not timers.ready(self.fire_timer):
             return None
 
         if dir_x and dir_y:
@@ -193,16 +156,18 @@ class Player:
             vy = self.BULLET_SPEED * dir_y
 
         cx, cy = self.rect.centerx, self.rect.centery
-        p = Projectile(cx, cy, w=6, h=6, vx=vx, vy=vy, ttl=1.2, dmg=1)
+        p = Projectile(
+            cx, cy, w=6, h=6, vx=vx, vy=vy, ttl=1.2, dmg=1, sprite=sprites.PLAYER_BOLT
+        )
 
-        self.fire_timer = self.fire_cooldown
+        timers.start(self.fire_timer, self.fire_cooldown)
         return p
 
     def take_damage(self, dmg=1):
-        if self.invuln > 0.0 or self.hp <= 0:
+        if not timers.ready(self.invuln) or self.hp <= 0:
             return
         self.hp = max(0, self.hp - int(dmg))
-        self.invuln = self.invuln_time
+        timers.start(self.invuln, self.invuln_time)
         self._play_hurt_sound()
 
     def _play_hurt_sound(self):
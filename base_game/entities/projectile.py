@@ -1,8 +1,10 @@
 from pygame import Rect
 
+from ..systems import sprites
+
 
 class Projectile:
-    __slots__ = ("rect", "vx", "vy", "ttl", "dmg", "alive", "team", "sprite", "owner")
+    __slots__ = ("rect", "vx", "vy", "ttl", "dmg", "alive", "team", "sprite", "owner", "image")
 
     def __init__(
         self, x, y, w=6, h=6, vx=0.0, vy=0.0, ttl=1.2, dmg=1, team="player", sprite=None, owner=None
@@ -16,6 +18,7 @@ class Projectile:
         self.team = team
         self.sprite = sprite
         self.owner = owner
+        self.image = sprites.resolve(sprite, vx, vy) if sprite else None
 
     def update(self, dt):
         if not self.alive:
@@ -25,3 +28,16 @@ class Projectile:
         self.ttl -= dt
         if self.ttl <= 0:
             self.alive = False
+
+    def draw(self, ctx, cam_x, cam_y):
+        img = self.image
+        if img is None:
+            ctx.screen.draw.filled_rect(self.rect.move(-cam_x, -cam_y), (220, 220, 60))
+            return
+        ctx.screen.blit(
+            img,
+            (
+                self.rect.centerx - cam_x - img.get_width() // 2,
+                self.rect.centery - cam_y - img.get_height() // 2,
+            ),
+        )
@@ -1,9 +1,11 @@
 import math
 from pygame import Rect
 from .enemy import Enemy
-from ..utils.animation import Animation, DirectionalAnimation
-from pgzero.loaders import images as pgz_images
-import random
+from ..systems.events import HIT_PLAYER
+from ..systems.steering import skeleton_steer
+from ..systems.timers import timers
+from ..systems.assets import assets
+from ..utils.animation import DirectionalAnimation, clip
 
 def _norm(vx, vy):
     length = math.hypot(vx, vy)
@@ -17,80 +19,71 @@ class SkeletonEnemy(Enemy):
     CONTACT_DAMAGE   = 1
     ATTACK_ANIM_TIME = 0.35  
 
-    def __init__(self, x, y):
-        super().__init__(x, y, w=24, h=24, max_hp=8, speed=110, counts_for_clear=True)
-        self._atk_cd   = 0.0
-        self._attack_t = 0.0
+    _CLIPS = None
+
+    def __init__(self, x, y, rng=None):
+        super().__init__(x, y, w=24, h=24, max_hp=8, speed=110, counts_for_clear=True, rng=rng)
+        self._atk_cd   = self.timer()
+        self._attack_t = self.timer()
+        self._attacking = False
         self._attack_dir = "down"
-        self._orbit_sign = 1 if random.random() < 0.5 else -1 
+        self._orbit_sign = 1 if self.rng.random() < 0.5 else -1 
         self._side_t = 0.0       
         self._side_sign = 0    
         self._detour = None       
-        self._detour_timer = 0.0   
+        self._detour_timer = self.timer()
         self._blocked_t = 0.0    
-        def frames_fixed(prefix, n):
-            return [f"enemies/skeleton/{prefix}_{i}" for i in range(n)]
-       
-        def frames_existing(prefix, max_frames=12):
-            names = []
-            for i in range(max_frames):
-                name = f"enemies/skeleton/{prefix}_{i}"
-                try:
-                    pgz_images.load(name) 
-                    names.append(name)
-                except Exception:
-                    break
-            return names or [f"enemies/skeleton/{prefix}_0"]
-
-        self.anim = DirectionalAnimation({
-            "down":  Animation(frames_fixed("skel_walk_right", 6), fps=10),
-            "up":    Animation(frames_fixed("skel_walk_down",  6), fps=10),
-            "left":  Animation(frames_fixed("skel_walk_left",  6), fps=10),
-            "right": Animation(frames_fixed("skel_walk_up",    6), fps=10),
-        }, default_dir="down")
-
-        self.anim_attack = DirectionalAnimation({
-            "down":  Animation(frames_existing("skel_slash_right"), fps=12),
-            "up":    Animation(frames_existing("skel_slash_down"),  fps=12),
-            "left":  Animation(frames_existing("skel_slash_left"),  fps=12),
-            "right": Animation(frames_existing("skel_slash_up"),    fps=12),
-        }, default_dir="down")
-
-        self._atk_cd = 0.0
-        self._attack_t = 0.0   
-    def act(self, dt, room, player_rect: Rect):
-        if self._atk_cd <= 0.0 and self._edge_gap(self.rect, player_rect) <= 3.0:
-            self._atk_cd = self.ATTACK_COOLDOWN
-            self._attack_t = self.ATTACK_ANIM_TIME
+        self._steer = None
+        clips = self.clips()
+        self.anim = DirectionalAnimation(clips["walk"], default_dir="down")
+        self.anim_attack = DirectionalAnimation(clips["attack"], default_dir="down")
+
+    @classmethod
+    def clips(cls):
+        if cls._CLIPS is None:
+            def walk(prefix):
+                return clip(assets.frame_names(f"enemies/skeleton/{prefix}"), fps=10)
+
+            def slash(prefix):
+                return clip(assets.frame_names(f"enemies/skeleton/{prefix}"), fps=12)
+
+            cls._CLIPS = {
+                "walk": {
+                    "down": walk("skel_walk_right"),
+                    "up": walk("skel_walk_down"),
+                    "left": walk("skel_walk_left"),
+                    "right": walk("skel_walk_up"),
+                },
+                "attack": {
+                    "down": slash("skel_slash_right"),
+                    "up": slash("skel_slash_down"),
+                    "left": slash("skel_slash_left"),
+                    "right": slash("skel_slash_up"),
+                },
+            }
+        return cls._CLIPS
+
+    def act(self, dt, room, player_rect: Rect, events):
+        if timers.ready(self._atk_cd) and self._edge_gap(self.rect, player_rect) <= 3.0:
+            timers.start(self._atk_cd, self.ATTACK_COOLDOWN)
+            timers.start(self._attack_t, self.ATTACK_ANIM_TIME)
+            self._attacking = True
             self._attack_dir = self.last_dir  
 
-            try:
-                a = self.anim_attack.anims[self._attack_dir]
-                a.i = 0
-                a.t = 0.0
-            except Exception:
-                pass
-
-            return ("HIT_PLAYER", self.CONTACT_DAMAGE)
+            self.anim_attack.reset()
 
-        return None
+            events.push(HIT_PLAYER, self.CONTACT_DAMAGE)
     
     def think(self, dt, room, player_rect: Rect):
-        self._atk_cd = max(0.0, self._atk_cd - dt)
+        if self._attacking and self._edge_gap(self.rect, player_rect) > 6.0:
+            timers.cancel(self._attack_t)
 
-        if self._attack_t > 0.0 and self._edge_gap(self.rect, player_rect) > 6.0:
-            self._attack_t = 0.0
+        if self._attacking and timers.ready(self._attack_t):
+            self._attacking = False
             self._side_t = 0.0
             self._side_sign = 0
 
-        prev = self._attack_t
-        self._attack_t = max(0.0, self._attack_t - dt)
-        if prev > 0.0 and self._attack_t == 0.0:
-            self._side_t = 0.0
-            self._side_sign = 0
-
-        self._detour_timer = max(0.0, self._detour_timer - dt)
-        if self._detour_timer == 0.0:
+        if timers.ready(self._detour_timer):
             self._detour = None
 
         self._blocked_t = max(0.0, self._blocked_t - dt*0.5)
@@ -130,17 +123,17 @@ class SkeletonEnemy(Enemy):
         return best
     
     def sense(self, dt, room, player_rect: Rect):
-        dx = player_rect.centerx - self.rect.centerx
-        dy = player_rect.centery - self.rect.centery
-        dist = math.hypot(dx, dy)
-        if dist > 1e-6:
-            nx, ny = dx / dist, dy / dist
-        else:
-            nx, ny = 0.0, 0.0
+        steer = self._steer
+        self._steer = None
+        if steer is None:
+            steer = skeleton_steer(
+                self.rect, player_rect, getattr(room, "_steer_cells", {}), self.ATTACK_RANGE
+            )
+        nx, ny, dist, sep_x, sep_y = steer
 
         vx = vy = 0.0
 
-        if self._attack_t > 0.0:
+        if not timers.ready(self._attack_t):
             gap = self._edge_gap(self.rect, player_rect)
             if gap > 0.5:
                 vx += nx * 0.35
@@ -160,7 +153,7 @@ class SkeletonEnemy(Enemy):
             else:
                 self._blocked_t = max(0.0, self._blocked_t - dt*0.5)
 
-            if self._detour and self._detour_timer > 0.0:
+            if self._detour and not timers.ready(self._detour_timer):
                 txg = self._detour[0] - self.rect.centerx
                 tyg = self._detour[1] - self.rect.centery
                 Lg = math.hypot(txg, tyg)
@@ -169,7 +162,7 @@ class SkeletonEnemy(Enemy):
                     vy += (tyg / Lg)
                 if Lg <= 6.0 or self._blocked_t <= 0.05:
                     self._detour = None
-                    self._detour_timer = 0.0
+                    timers.cancel(self._detour_timer)
 
             else:
                 if dist > ATTACK_ZONE + FLEX:
@@ -185,21 +178,10 @@ class SkeletonEnemy(Enemy):
                     tgt = self._pick_detour_target(player_rect, nx, ny, others)
                     if tgt:
                         self._detour = tgt
-                        self._detour_timer = 0.40
-
-            SEP_RADIUS = 30 if dist <= (self.ATTACK_RANGE + 6) else 28
-            SEP_R2 = SEP_RADIUS * SEP_RADIUS
-            for r in getattr(room, "_enemy_rects", []):
-                if r is self.rect:
-                    continue
-                dx2 = self.rect.centerx - r.centerx
-                dy2 = self.rect.centery - r.centery
-                d2 = dx2*dx2 + dy2*dy2
-                if 0 < d2 < SEP_R2:
-                    inv = 1.0 / (math.sqrt(d2) + 1e-6)
-                    push = 0.7 if dist <= (self.ATTACK_RANGE + 6) else 0.6
-                    vx += dx2 * inv * push
-                    vy += dy2 * inv * push
+                        timers.start(self._detour_timer, 0.40)
+
+            vx += sep_x
+            vy += sep_y
 
         L = math.hypot(vx, vy)
         if L > 1e-6:
@@ -210,9 +192,8 @@ class SkeletonEnemy(Enemy):
 
 
     def draw(self, ctx, cam_x, cam_y):
-        if self._attack_t > 0.0 and self.anim_attack:
+        if not timers.ready(self._attack_t) and self.anim_attack:
             self.anim_attack.set_dir(self._attack_dir)  
-            self.anim_attack.update(1/60.0, True)
             img = self.anim_attack.get()
         else:
             if self.anim:
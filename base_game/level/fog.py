@@ -0,0 +1,138 @@
+import struct
+import zlib
+from collections import OrderedDict
+
+import pygame
+
+from ..systems.render import LAYER_FOG
+from ..systems.trace import tracer
+from . import tiles
+
+MAGIC = b"KFOG"
+VERSION = 1
+CHUNK = 8
+FOG_COLOR = (0, 0, 0)
+SURFACES_MAX = 64
+
+_HEADER = struct.Struct("<4sHII")
+_POPCOUNT = bytes(bin(i).count("1") for i in range(256))
+
+
+class FogOfWar:
+    def __init__(self, width, height, bits=None):
+        self.width = width
+        self.height = height
+        size = (width * height + 7) // 8
+        self.bits = bytearray(size) if bits is None else bytearray(bits)
+        if len(self.bits) != size:
+            raise ValueError(f"expected {size} bytes of fog bits, got {len(self.bits)}")
+        self.cols = (width + CHUNK - 1) // CHUNK
+        self.rows = (height + CHUNK - 1) // CHUNK
+        self._counts = bytearray(self.cols * self.rows)
+        self._surfs = OrderedDict()
+        self._solid = None
+        if bits is not None:
+            self._recount()
+
+    def _recount(self):
+        w, cols, bits = self.width, self.cols, self.bits
+        mask = (1 << w) - 1
+        for cy in range(self.rows):
+            acc = 0
+            for gy in range(cy * CHUNK, min(self.height, (cy + 1) * CHUNK)):
+                i = gy * w
+                row = int.from_bytes(bits[i >> 3:(i + w + 7) >> 3], "little") >> (i & 7)
+                counts = (row & mask).to_bytes(cols, "little").translate(_POPCOUNT)
+                acc += int.from_bytes(counts, "little")
+            self._counts[cy * cols:(cy + 1) * cols] = acc.to_bytes(cols, "little")
+
+    @classmethod
+    def for_room(cls, room):
+        return cls(len(room.grid[0]), len(room.grid))
+
+    def explored(self, gx, gy):
+        if 0 <= gx < self.width and 0 <= gy < self.height:
+            i = gy * self.width + gx
+            return (self.bits[i >> 3] >> (i & 7)) & 1
+        return 0
+
+    def _reveal_row(self, gy, x0, x1):
+        if gy < 0 or gy >= self.height:
+            return
+        x0, x1 = max(0, x0), min(self.width, x1)
+        bits, counts, surfs = self.bits, self._counts, self._surfs
+        base = gy * self.width
+        row = (gy // CHUNK) * self.cols
+        for gx in range(x0, x1):
+            i = base + gx
+            m = 1 << (i & 7)
+            if not bits[i >> 3] & m:
+                bits[i >> 3] |= m
+                k = row + gx // CHUNK
+                counts[k] += 1
+                surfs.pop(k, None)
+
+    def reveal_rect(self, rect):
+        for gy in range(rect.top, rect.bottom):
+            self._reveal_row(gy, rect.left, rect.right)
+
+    def reveal_radius(self, gx, gy, radius):
+        for dy in range(-radius, radius + 1):
+            span = int((radius * radius - dy * dy) ** 0.5)
+            self._reveal_row(gy + dy, gx - span, gx + span + 1)
+
+    def _capacity(self, cx, cy):
+        w = min(CHUNK, self.width - cx * CHUNK)
+        h = min(CHUNK, self.height - cy * CHUNK)
+        return w * h
+
+    def _chunk_surface(self, cx, cy):
+        k = cy * self.cols + cx
+        surf = self._surfs.get(k)
+        if surf is not None:
+            self._surfs.move_to_end(k)
+            return surf
+        with tracer.span("FogOfWar.chunk"):
+            mask = pygame.Surface((CHUNK, CHUNK), pygame.SRCALPHA)
+            mask.fill((*FOG_COLOR, 255))
+            for y in range(CHUNK):
+                for x in range(CHUNK):
+                    if self.explored(cx * CHUNK + x, cy * CHUNK + y):
+                        mask.set_at((x, y), (*FOG_COLOR, 0))
+            px = CHUNK * tiles.TILE
+            surf = pygame.transform.scale(mask, (px, px))
+            if pygame.display.get_surface() is not None:
+                surf = surf.convert_alpha()
+            surf.set_alpha(255, pygame.RLEACCEL)
+        self._surfs[k] = surf
+        if len(self._surfs) > SURFACES_MAX:
+            self._surfs.popitem(last=False)
+        return surf
+
+    def draw(self, queue, cam_x, cam_y):
+        px = CHUNK * tiles.TILE
+        if self._solid is None:
+            self._solid = pygame.Surface((px, px))
+            self._solid.fill(FOG_COLOR)
+        target = queue.target(LAYER_FOG)
+        counts = self._counts
+        x0, x1 = max(0, cam_x // px), min(self.cols, (cam_x + queue.width - 1) // px + 1)
+        y0, y1 = max(0, cam_y // px), min(self.rows, (cam_y + queue.height - 1) // px + 1)
+        for cy in range(y0, y1):
+            for cx in range(x0, x1):
+                n = counts[cy * self.cols + cx]
+                if n == self._capacity(cx, cy):
+                    continue
+                surf = self._solid if n == 0 else self._chunk_surface(cx, cy)
+                target.blit(surf, (cx * px - cam_x, cy * px - cam_y))
+
+    def to_bytes(self):
+        header = _HEADER.pack(MAGIC, VERSION, self.width, self.height)
+        return header + zlib.compress(bytes(self.bits), 9)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, width, height = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"not a v{VERSION} fog-of-war blob")
+        return cls(width, height, zlib.decompress(data[_HEADER.size:]))
@@ -0,0 +1,130 @@
+from collections import OrderedDict
+
+import pygame
+from pygame import Rect
+
+from ..systems.render import LAYER_LIGHT
+from ..systems.trace import tracer
+from . import tiles
+
+AMBIENT = (115, 110, 130)
+TORCH = (220, 120, 40)
+TORCH_RADIUS = 5
+DOWNSCALE = 4
+CELL = 16
+MAPS_MAX = 8
+MAX_DYNAMIC = 32
+
+_GLOWS = {}
+_FLAME = []
+
+
+def glow(radius, color):
+    k = (radius, tuple(color))
+    surf = _GLOWS.get(k)
+    if surf is None:
+        surf = pygame.Surface((radius * 2, radius * 2))
+        surf.fill((0, 0, 0))
+        steps = max(1, min(radius, 32))
+        for i in range(steps):
+            f = ((i + 1) / steps) ** 1.5
+            r = max(1, int(radius * (1 - i / steps)))
+            c = (int(color[0] * f), int(color[1] * f), int(color[2] * f))
+            pygame.draw.circle(surf, c, (radius, radius), r)
+        _GLOWS[k] = surf
+    return surf
+
+
+def flame():
+    if not _FLAME:
+        surf = pygame.Surface((8, 14), pygame.SRCALPHA)
+        pygame.draw.rect(surf, (90, 60, 30), (3, 8, 2, 6))
+        pygame.draw.ellipse(surf, (240, 120, 30), (1, 0, 6, 10))
+        pygame.draw.ellipse(surf, (255, 230, 120), (3, 4, 2, 5))
+        _FLAME.append(surf)
+    return _FLAME[0]
+
+
+def torches(meta):
+    inner = meta["rect_inner_g"]
+    t = tiles.TILE
+    y = inner.top * t
+    xs = {inner.left + inner.w // 4, inner.right - 1 - inner.w // 4}
+    return [(gx * t + t // 2, y) for gx in sorted(xs)]
+
+
+def bake_room(meta):
+    rect = meta["rect_g"]
+    t = tiles.TILE
+    s = t // DOWNSCALE
+    surf = pygame.Surface((rect.w * s, rect.h * s))
+    surf.fill(AMBIENT)
+    radius = TORCH_RADIUS * s
+    light = glow(radius, TORCH)
+    for x, y in torches(meta):
+        lx = (x - rect.x * t) // DOWNSCALE - radius
+        ly = (y - rect.y * t) // DOWNSCALE - radius
+        surf.blit(light, (lx, ly), special_flags=pygame.BLEND_ADD)
+    return surf
+
+
+class Lighting:
+    def __init__(self, room):
+        self.room = room
+        with tracer.span("Lighting.bake"):
+            self.lightmaps = [bake_room(m) for m in room.rooms_meta]
+        self._cells = {}
+        for meta in room.rooms_meta:
+            r = meta["rect_g"]
+            for cy in range(r.top // CELL, (r.bottom - 1) // CELL + 1):
+                for cx in range(r.left // CELL, (r.right - 1) // CELL + 1):
+                    self._cells.setdefault((cx, cy), []).append(meta["id"])
+        self._maps = OrderedDict()
+        self._buffer = None
+        torch = flame()
+        for meta in room.rooms_meta:
+            for x, y in torches(meta):
+                room.add_prop(torch, (x - 4, y - 20), y)
+
+    def _room_map(self, rid):
+        surf = self._maps.get(rid)
+        if surf is not None:
+            self._maps.move_to_end(rid)
+            return surf
+        rect = self.room.rooms_meta[rid]["rect_g"]
+        t = tiles.TILE
+        surf = pygame.transform.smoothscale(self.lightmaps[rid], (rect.w * t, rect.h * t))
+        self._maps[rid] = surf
+        if len(self._maps) > MAPS_MAX:
+            self._maps.popitem(last=False)
+        return surf
+
+    def _rooms_in(self, view):
+        t = tiles.TILE * CELL
+        found = set()
+        for cy in range(view.top // t, (view.bottom - 1) // t + 1):
+            for cx in range(view.left // t, (view.right - 1) // t + 1):
+                found.update(self._cells.get((cx, cy), ()))
+        return sorted(found)
+
+    def draw(self, queue, cam_x, cam_y, lights=()):
+        w, h = queue.width, queue.height
+        if self._buffer is None or self._buffer.get_size() != (w, h):
+            self._buffer = pygame.Surface((w, h))
+        buf = self._buffer
+        buf.fill(AMBIENT)
+        t = tiles.TILE
+        view = Rect(cam_x, cam_y, w, h)
+        for rid in self._rooms_in(view):
+            meta = self.room.rooms_meta[rid]
+            rect = meta["rect_g"]
+            buf.blit(self._room_map(rid), (rect.x * t - cam_x, rect.y * t - cam_y))
+        for i, (x, y, radius, color) in enumerate(lights):
+            if i >= MAX_DYNAMIC:
+                break
+            buf.blit(
+                glow(radius, color),
+                (x - cam_x - radius, y - cam_y - radius),
+                special_flags=pygame.BLEND_ADD,
+            )
+        queue.blit(LAYER_LIGHT, buf, (0, 0), special_flags=pygame.BLEND_MULT)
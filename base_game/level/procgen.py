@@ -3,6 +3,7 @@ import random
 
 from pygame import Rect
 
+from ..systems.trace import tracer
 from . import tiles
 from .room import Room
 
@@ -56,10 +57,16 @@ def _overlap_padded(a, b, pad_x, pad_y):
     return not (ax1 <= bx0 or bx1 <= ax0 or ay1 <= by0 or by1 <= ay0)
 
 
-def generate_world(seed=None, target_rooms=6, first_size=(20, 15), min_size=15, max_size=30):
+def generate_world(
+    seed=None, target_rooms=6, first_size=(20, 15), min_size=15, max_size=30, rng=None
+):
+    if rng is None:
+        rng = random.Random(seed)
+    with tracer.span("generate_world"):
+        return _generate_world(rng, target_rooms, first_size, min_size, max_size)
 
-    if seed is not None:
-        random.seed(seed)
+
+def _generate_world(rng, target_rooms, first_size, min_size, max_size):
 
     rooms = []
     links = []
@@ -73,12 +80,12 @@ def generate_world(seed=None, target_rooms=6, first_size=(20, 15), min_size=15,
     tries = 0
     while len(rooms) < target_rooms and tries < max_tries and frontier:
         tries += 1
-        base_idx = random.choice(frontier)
+        base_idx = rng.choice(frontier)
         base = rooms[base_idx]
 
-        for side in random.sample(["U", "D", "L", "R"], 4):
-            w = random.randint(min_size, max_size)
-            h = random.randint(min_size, max_size)
+        for side in rng.sample(["U", "D", "L", "R"], 4):
+            w = rng.randint(min_size, max_size)
+            h = rng.randint(min_size, max_size)
 
             cand = _place_adjacent(base, side, w, h)
 
@@ -97,7 +104,7 @@ def generate_world(seed=None, target_rooms=6, first_size=(20, 15), min_size=15,
             links.append((base_idx, b_idx, side))
             break
 
-        if random.random() < 0.35:
+        if rng.random() < 0.35:
             try:
                 frontier.remove(base_idx)
             except ValueError:
@@ -1,17 +1,36 @@
 import os
+from types import SimpleNamespace
 
 from pygame import Rect
 
+from ..systems.render import LAYER_ACTORS, LAYER_FLOOR, LayerTarget, RenderQueue
+from ..systems.trace import tracer
 from . import tiles
 
+ROW_CHUNK = 16
+
 MAP_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "levels")
 
 
+class _Recorder(LayerTarget):
+    def __init__(self, queue):
+        super().__init__(queue, LAYER_ACTORS)
+        self.ctx = SimpleNamespace(screen=self)
+        self.blits = []
+
+    def blit(self, surf, dest, area=None, special_flags=0):
+        self.blits.append((surf, (dest[0], dest[1])))
+
+
 class Room:
     def __init__(self, grid, doors, spawn_xy):
         self.grid = grid
         self.doors = doors
         self.spawn_xy = spawn_xy
+        self._walls = {}
+        self._doors = None
+        self._props = {}
+        self._recorder = None
 
     def _is_wall(self, gx, gy):
         if gy < 0 or gy >= len(self.grid):
@@ -57,10 +76,21 @@ class Room:
 
         return self
 
-    def draw(self, ctx, cam_offset=(0, 0)):
+    def draw(self, ctx, cam_offset=(0, 0), queue=None):
+        with tracer.span("Room.draw"):
+            if queue is not None:
+                self._draw(queue, cam_offset)
+                return
+            queue = RenderQueue()
+            queue.begin(ctx.screen.width, ctx.screen.height)
+            self._draw(queue, cam_offset)
+            queue.flush(ctx.screen.surface)
+
+    def _draw(self, queue, cam_offset):
         ox, oy = cam_offset
         ts = tiles.TILE
-        sw, sh = ctx.screen.width, ctx.screen.height
+        sw, sh = queue.width, queue.height
+        ctx = queue.context(LAYER_FLOOR)
 
         height = len(self.grid)
         width = len(self.grid[0]) if height else 0
@@ -76,12 +106,6 @@ class Room:
         gy1 = min(max_y, (sh - 1 - oy) // ts)
 
         vpad = tiles.get_extra_wall_top(ctx) or 0
-        hpad = 48
-
-        wx0 = max(0, int((-ox - hpad) // ts))
-        wy0 = max(0, int((-oy - vpad) // ts))
-        wx1 = min(max_x, int((sw - 1 - ox + hpad) // ts))
-        wy1 = min(max_y, int((sh - 1 - oy + vpad) // ts))
 
         for gy in range(gy0, gy1 + 1):
             row = self.grid[gy]
@@ -113,104 +137,132 @@ class Room:
                 if down == int(tiles.Tile.VOID):
                     tiles.draw_hall_border(ctx, sx, sy, "D")
 
-        def at(x, y, default):
-            if y < 0 or y >= height or x < 0 or x >= width:
-                return default
-            return self.grid[y][x]
-
+        run = queue.target(LAYER_ACTORS, run="room")
+        door_state = getattr(self, "door_state", None) or {}
+        doors = self._door_buckets()
+        props = self._props
+        c = ROW_CHUNK
+        ry0 = max(0, (-oy - tiles.DOOR_H) // ts - 1)
+        ry1 = min(max_y, (sh - 1 - oy + vpad) // ts)
+        cx0 = max(0, (-ox - tiles.DOOR_W) // ts) // c
+        cx1 = min(max_x, (sw - 1 - ox + tiles.DOOR_W) // ts) // c
+
+        for gy in range(ry0, ry1 + 1):
+            run.depth = (gy + 1) * ts
+            for cx in range(cx0, cx1 + 1):
+                for surf, (x, y) in self._wall_bucket(gy, cx):
+                    run.blit(surf, (x + ox, y + oy))
+            for cx in range(cx0, cx1 + 1):
+                for key, opened, closed in doors.get((gy, cx), ()):
+                    for surf, (x, y) in opened if door_state.get(key, True) else closed:
+                        run.blit(surf, (x + ox, y + oy))
+            for cx in range(cx0, cx1 + 1):
+                for surf, (x, y) in props.get((gy, cx), ()):
+                    run.blit(surf, (x + ox, y + oy))
+
+    def add_prop(self, surf, pos, depth):
+        ts = tiles.TILE
+        key = ((depth - 1) // ts, pos[0] // ts // ROW_CHUNK)
+        self._props.setdefault(key, []).append((surf, pos))
+
+    def _record(self, draw, *args):
+        rec = self._recorder
+        if rec is None:
+            rec = self._recorder = _Recorder(RenderQueue())
+        rec.blits = []
+        draw(rec.ctx, *args)
+        return rec.blits
+
+    def _wall_bucket(self, gy, cx):
+        bucket = self._walls.get((gy, cx))
+        if bucket is not None:
+            return bucket
+        ts = tiles.TILE
+        height = len(self.grid)
+        width = len(self.grid[0])
+        wall_id = int(tiles.Tile.WALL)
         void_id = int(tiles.Tile.VOID)
         floor_id = int(tiles.Tile.FLOOR)
         door_id = int(tiles.Tile.DOOR)
+        open_ids = (floor_id, door_id)
 
-        for gy in range(wy0, wy1 + 1):
-            for gx in range(wx0, wx1 + 1):
-                if tiles.Tile(self.grid[gy][gx]) != tiles.Tile.WALL:
-                    continue
-
-                north = at(gx, gy - 1, void_id)
-                south = at(gx, gy + 1, void_id)
-                left_v = at(gx - 1, gy, void_id)
-                right_v = at(gx + 1, gy, void_id)
+        def at(x, y):
+            if y < 0 or y >= height or x < 0 or x >= width:
+                return void_id
+            return self.grid[y][x]
 
-                sx = gx * ts + ox
-                sy = gy * ts + oy
+        bucket = []
+        for gx in range(cx * ROW_CHUNK, min(width, (cx + 1) * ROW_CHUNK)):
+            if self.grid[gy][gx] != wall_id:
+                continue
 
-                if north != int(tiles.Tile.WALL) and south in (floor_id, door_id):
-                    tiles.draw_wall_top_32x76(ctx, sx, sy)
+            north = at(gx, gy - 1)
+            south = at(gx, gy + 1)
+            left_v = at(gx - 1, gy)
+            right_v = at(gx + 1, gy)
 
-                if south == void_id and north in (floor_id, door_id):
-                    tiles.draw_wall_bottom(ctx, sx, sy)
+            sx = gx * ts
+            sy = gy * ts
 
-                if left_v == void_id and right_v in (floor_id, door_id):
-                    tiles.draw_wall_side_12x32(ctx, sx, sy, "L")
+            if north != wall_id and south in open_ids:
+                bucket += self._record(tiles.draw_wall_top_32x76, sx, sy)
 
-                if right_v == void_id and left_v in (floor_id, door_id):
-                    tiles.draw_wall_side_12x32(ctx, sx, sy, "R")
+            if south == void_id and north in open_ids:
+                bucket += self._record(tiles.draw_wall_bottom, sx, sy)
 
-                if north == void_id and left_v == void_id:
-                    tiles.draw_corner_top_left(ctx, sx, sy)
-                if north == void_id and right_v == void_id:
-                    tiles.draw_corner_top_right(ctx, sx, sy)
-                if south == void_id and left_v == void_id:
-                    tiles.draw_corner_bottom_left(ctx, sx, sy)
-                if south == void_id and right_v == void_id:
-                    tiles.draw_corner_bottom_right(ctx, sx, sy)
+            if left_v == void_id and right_v in open_ids:
+                bucket += self._record(tiles.draw_wall_side_12x32, sx, sy, "L")
 
-        hall_id = int(tiles.Tile.HALL)
-        outside_ids = (void_id, hall_id)
+            if right_v == void_id and left_v in open_ids:
+                bucket += self._record(tiles.draw_wall_side_12x32, sx, sy, "R")
 
-        door_state = getattr(self, "door_state", None)
+            if north == void_id and left_v == void_id:
+                bucket += self._record(tiles.draw_corner_top_left, sx, sy)
+            if north == void_id and right_v == void_id:
+                bucket += self._record(tiles.draw_corner_top_right, sx, sy)
+            if south == void_id and left_v == void_id:
+                bucket += self._record(tiles.draw_corner_bottom_left, sx, sy)
+            if south == void_id and right_v == void_id:
+                bucket += self._record(tiles.draw_corner_bottom_right, sx, sy)
 
-        for key, r in self.doors.items():
-            orient, _kx, _ky = key
+        self._walls[(gy, cx)] = bucket
+        return bucket
 
-            dx = r.x // tiles.TILE
-            dy = r.y // tiles.TILE
+    def _door_buckets(self):
+        if self._doors is not None:
+            return self._doors
+        ts = tiles.TILE
+        height = len(self.grid)
+        width = len(self.grid[0])
+        void_id = int(tiles.Tile.VOID)
+        outside_ids = (void_id, int(tiles.Tile.HALL))
 
-            def at2(x, y, default):
-                if y < 0 or y >= height or x < 0 or x >= width:
-                    return default
-                return self.grid[y][x]
+        def at(x, y):
+            if y < 0 or y >= height or x < 0 or x >= width:
+                return void_id
+            return self.grid[y][x]
 
-            if orient == "H":
-                if at2(dx, dy - 1, void_id) in outside_ids:
+        self._doors = {}
+        for key, r in self.doors.items():
+            dx = r.x // ts
+            dy = r.y // ts
+            if key[0] == "H":
+                if at(dx, dy - 1) in outside_ids:
                     facing = "UP"
-                elif at2(dx, dy + 1, void_id) in outside_ids:
+                elif at(dx, dy + 1) in outside_ids:
                     facing = "DOWN"
                 else:
                     facing = "UP"
             else:
-                if at2(dx - 1, dy, void_id) in outside_ids:
+                if at(dx - 1, dy) in outside_ids:
                     facing = "LEFT"
-                elif at2(dx + 1, dy, void_id) in outside_ids:
+                elif at(dx + 1, dy) in outside_ids:
                     facing = "RIGHT"
                 else:
                     facing = "LEFT"
 
-            bx, by, bw, bh = tiles.door_bbox_px(facing, r.x, r.y)
-            sx0 = bx + ox
-            sy0 = by + oy
-            sx1 = sx0 + bw
-            sy1 = sy0 + bh
-
-            margin_left = 12
-            margin_right = 12
-            margin_top = 12
-            margin_bottom = 12
-
-            if facing == "LEFT":
-                margin_right = 48
-
-            if (
-                (sx1 < -margin_left)
-                or (sx0 > sw + margin_right)
-                or (sy1 < -margin_top)
-                or (sy0 > sh + margin_bottom)
-            ):
-                continue
-
-            is_open = True if door_state is None else door_state.get(key, True)
-            if is_open:
-                tiles.draw_open_door(ctx, facing, r.x + ox, r.y + oy)
-            else:
-                tiles.draw_closed_door(ctx, facing, r.x + ox, r.y + oy)
+            opened = self._record(tiles.draw_open_door, facing, r.x, r.y)
+            closed = self._record(tiles.draw_closed_door, facing, r.x, r.y)
+            bucket = (r.top // ts - 1, dx // ROW_CHUNK)
+            self._doors.setdefault(bucket, []).append((key, opened, closed))
+        return self._doors
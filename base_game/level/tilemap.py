@@ -2,6 +2,7 @@ import os
 
 from pygame import Rect
 
+from ..systems.assets import assets
 from . import tiles
 
 
@@ -53,7 +54,7 @@ class Tilemap:
                 sheet_name, src = tiles.sprite_info(tid)
                 x, y = gx * ts, gy * ts
                 if sheet_name and src:
-                    sheet = ctx.images.load(sheet_name)
+                    sheet = assets.image(sheet_name)
                     sgx, sgy = src
                     area = Rect(sgx * ts, sgy * ts, ts, ts)
                     ctx.screen.surface.blit(sheet, (x, y), area)
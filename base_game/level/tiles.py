@@ -2,6 +2,8 @@ from enum import IntEnum
 
 from pygame import Rect
 
+from ..systems.assets import assets
+
 TILE = 32
 TOP_CAP_H = 72
 EXTRA_WALL_TOP = TOP_CAP_H - TILE
@@ -52,7 +54,7 @@ def draw_tile(ctx, tid: int, x: int, y: int):
     if t in (Tile.FLOOR, Tile.HALL):
         name = PROPS.get(t, {}).get("sprite") or "floor"
         try:
-            spr = ctx.images.load(name)
+            spr = assets.image(name)
             ctx.screen.blit(spr, (x, y))
         except Exception:
             ctx.screen.draw.filled_rect(Rect(x, y, TILE, TILE), (35, 35, 35))
@@ -136,7 +138,7 @@ def draw_corner_bottom_right(ctx, x, y):
 
 def _try_load(ctx, name):
     try:
-        return ctx.images.load(name)
+        return assets.image(name)
     except Exception as e:
         print(f"[IMG] missing '{name}.png' ? -> {e}")
         return None
@@ -1,27 +1,32 @@
+import os
 from types import SimpleNamespace
 
 from base_game import config
-from base_game.app import SceneManager
-from base_game.scenes.menu import MenuScene
-from base_game.scenes.pause import PauseScene
-from base_game.scenes.play import PlayScene
-from base_game.scenes.you_win import YouWinScene
-
-from .scenes.game_over import GameOverScene
+from base_game.app import build_manager
+from base_game.systems.replay import SessionRecorder
+from base_game.systems.trace import tracer
 
 WIDTH, HEIGHT = config.WIDTH, config.HEIGHT
 TITLE = config.TITLE
 
 
-manager = SceneManager()
-manager.register("menu", MenuScene())
-manager.register("play", PlayScene())
-manager.register("pause", PauseScene())
-manager.register("game_over", GameOverScene())
-manager.register("you_win", YouWinScene())
-
+manager = build_manager()
 manager.change("menu")
 
+recorder = None
+if os.environ.get("KODLAND_RECORD"):
+    recorder = SessionRecorder(os.environ["KODLAND_RECORD"])
+
+if "KODLAND_TRACE" in os.environ:
+    _trace = os.environ["KODLAND_TRACE"]
+    try:
+        _trace_seconds = float(_trace)
+    except ValueError:
+        if _trace:
+            print(f"[TRACE] ignoring non-numeric KODLAND_TRACE={_trace!r}")
+        _trace_seconds = config.TRACE_SECONDS
+    tracer.start(_trace_seconds)
+
 _ctx_cache = None
 
 
@@ -46,7 +51,14 @@ def get_ctx():
 
 
 def update(dt):
-    manager.update(dt, get_ctx())
+    tracer.tick()
+    tracer.counter("frame", dt_ms=dt * 1000.0)
+    ctx = get_ctx()
+    if recorder:
+        recorder.before_update(manager, dt, ctx)
+    manager.update(dt, ctx)
+    if recorder:
+        recorder.after_update(manager)
 
 
 def draw():
@@ -54,7 +66,14 @@ def draw():
 
 
 def on_key_down(key):
-    manager.on_key_down(key, get_ctx())
+    ctx = get_ctx()
+    if ctx.keys is not None and key == ctx.keys.F9:
+        if tracer.active:
+            tracer.stop()
+        else:
+            tracer.start()
+        return
+    manager.on_key_down(key, ctx)
 
 
 def on_key_up(key):
@@ -65,6 +84,16 @@ def on_mouse_down(pos, button):
     manager.on_mouse_down(pos, button, get_ctx())
 
 
+def on_mouse_up(pos, button):
+    manager.on_mouse_up(pos, button, get_ctx())
+
+
+def on_mouse_move(pos):
+    ctx = get_ctx()
+    ctx.mouse_pos = pos
+    manager.on_mouse_move(pos, ctx)
+
+
 if __name__ == "__main__":
     import pgzrun
 
@@ -0,0 +1,60 @@
+import argparse
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a recorded play session.")
+    parser.add_argument("path")
+    parser.add_argument("--headless", action="store_true", help="no window, run at full speed")
+    args = parser.parse_args(argv)
+
+    if args.headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+    import pygame
+    from pgzero import loaders
+    from pgzero.constants import keys
+    from pgzero.screen import Screen
+
+    from base_game import config
+    from base_game.app import build_manager
+    from base_game.systems.replay import Replay, play_back
+
+    pygame.init()
+    surface = pygame.display.set_mode((config.WIDTH, config.HEIGHT))
+    pygame.display.set_caption(config.TITLE + " (replay)")
+
+    manager = build_manager()
+    loaders.set_root(os.path.dirname(__file__))
+    screen = None if args.headless else Screen(surface)
+    ctx = SimpleNamespace(screen=screen, keyboard=None, keys=keys, images=loaders.images)
+
+    draw = None
+    if not args.headless:
+        clock = pygame.time.Clock()
+
+        def draw():
+            pygame.event.pump()
+            manager.draw(ctx)
+            pygame.display.flip()
+            clock.tick(config.FPS)
+
+    replay = Replay.load(args.path)
+    t0 = time.perf_counter()
+    ticks, digest = play_back(replay, manager, ctx, draw=draw)
+    elapsed = time.perf_counter() - t0
+
+    print(f"seed {replay.seed}: {ticks}/{len(replay)} ticks in {elapsed:.3f}s")
+    if replay.digest:
+        ok = digest == replay.digest
+        print("state digest", "matches" if ok else "MISMATCH", digest.hex()[:16])
+        return 0 if ok else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,15 @@
+from pygame import Rect
+
+
 class BaseScene:
+    DIRTY_RECTS = False
+    BACKDROP = None
+    NEXT_SCENES = ()
+
     def __init__(self):
         self._manager = None
+        self._dirty = None
+        self._backdrop = None
 
     def on_enter(self, *args, **kwargs):
         pass
@@ -8,12 +17,46 @@ class BaseScene:
     def on_exit(self):
         pass
 
+    def on_resume(self, *args, **kwargs):
+        pass
+
+    def prepare(self):
+        pass
+
     def update(self, dt, ctx):
         pass
 
     def draw(self, ctx):
         pass
 
+    def draw_dynamic(self, ctx, area):
+        pass
+
+    def invalidate(self, rect=None):
+        if rect is None or self._dirty is None:
+            self._dirty = None
+        else:
+            self._dirty.append(Rect(rect))
+
+    def render(self, ctx):
+        if not self.DIRTY_RECTS:
+            self.draw(ctx)
+            return None
+        surface = ctx.screen.surface
+        dirty, self._dirty = self._dirty, []
+        if dirty is None or self._backdrop is None or self._backdrop.get_size() != surface.get_size():
+            self.draw(ctx)
+            self._backdrop = surface.copy()
+            area = surface.get_rect()
+            self.draw_dynamic(ctx, area)
+            return [area]
+        for area in dirty:
+            surface.blit(self._backdrop, area, area)
+            surface.set_clip(area)
+            self.draw_dynamic(ctx, area)
+        surface.set_clip(None)
+        return dirty
+
     def on_key_down(self, key, ctx):
         pass
 
@@ -23,5 +66,11 @@ class BaseScene:
     def on_mouse_down(self, pos, button, ctx):
         pass
 
+    def on_mouse_up(self, pos, button, ctx):
+        pass
+
+    def on_mouse_move(self, pos, ctx):
+        pass
+
     def goto(self, name, *args, **kwargs):
         self._manager.change(name, *args, **kwargs)
@@ -3,63 +3,95 @@ import sys
 from pygame import Rect
 
 from .. import config
+from ..systems.assets import assets
+from ..ui import text
+from ..ui.widgets import Button, Label, Panel
 from .base import BaseScene
 
 
 class MenuScene(BaseScene):
-    def on_enter(self):
+    DIRTY_RECTS = True
+    BUTTON = {"fontsize": 32, "color": (70, 70, 70), "hover": (110, 110, 110)}
+
+    def prepare(self):
         self.btn_w, self.btn_h = 240, 60
-        self.color_btn = (70, 70, 70)
-        self.color_hover = (110, 110, 110)
+        self.color_btn = self.BUTTON["color"]
+        self.color_hover = self.BUTTON["hover"]
         self.color_text = (255, 255, 255)
-        self.hovered = None
-
-        self.center_x = config.WIDTH // 2
-        self.center_y = config.HEIGHT // 2
 
+        self.ui = Panel(self._layout)
+        self.title = self.ui.add(Label("Marcel's Game", 72, self.color_text, (2, 2)))
         self.buttons = {
-            "play": Rect(self.center_x - self.btn_w // 2, self.center_y, self.btn_w, self.btn_h),
-            "exit": Rect(
-                self.center_x - self.btn_w // 2, self.center_y + 80, self.btn_w, self.btn_h
-            ),
+            "play": self.ui.add(Button("Play Game", self._play, **self.BUTTON)),
+            "exit": self.ui.add(Button("Exit Game", self._exit, **self.BUTTON)),
         }
 
+    def _layout(self, ui, sw, sh):
+        self.center_x = sw // 2
+        self.center_y = sh // 2
+        left = self.center_x - self.btn_w // 2
+        self.title.place(center=(self.center_x, self.center_y - 150))
+        self.buttons["play"].place((left, self.center_y, self.btn_w, self.btn_h))
+        self.buttons["exit"].place((left, self.center_y + 80, self.btn_w, self.btn_h))
+        self.loading_rect = Rect(left, self.center_y + 170, self.btn_w, 36)
+
+    def on_enter(self):
+        self.load_progress = 1.0 if assets.ready else 0.0
+        self._shown_pct = None
+        self.ui.reset()
+        self.ui.layout(config.WIDTH, config.HEIGHT)
+
     def draw(self, ctx):
+        self.ui.layout(ctx.screen.width, ctx.screen.height)
         ctx.screen.clear()
         ctx.screen.fill((20, 16, 12))
+        self.ui.draw_static(ctx.screen)
 
-        ctx.screen.draw.text(
-            "Marcel's Game",
-            center=(self.center_x, self.center_y - 150),
-            fontsize=72,
-            color=(255, 255, 255),
-            shadow=(2, 2),
-        )
+    def draw_dynamic(self, ctx, area):
+        self.ui.draw_dynamic(ctx.screen, area)
 
-        mouse_x, mouse_y = getattr(ctx, "mouse_pos", (0, 0))
-        self.hovered = None
+        if self.load_progress < 1.0 and self.loading_rect.colliderect(area):
+            bar = Rect(self.loading_rect.x, self.loading_rect.y, self.loading_rect.w, 6)
+            ctx.screen.draw.filled_rect(bar, self.color_btn)
+            ctx.screen.draw.filled_rect(
+                Rect(bar.x, bar.y, int(bar.w * self.load_progress), bar.h), self.color_hover
+            )
+            label = text.render("Loading", 20, self.color_text)
+            digits = text.glyphs(20, self.color_text, text.DIGITS + "%")
+            pct = f"{int(self.load_progress * 100)}%"
+            gap = 5
+            x = self.center_x - (label.get_width() + gap + digits.width(pct)) // 2
+            ctx.screen.blit(label, (x, bar.bottom + 6))
+            digits.draw(ctx.screen, pct, topleft=(x + label.get_width() + gap, bar.bottom + 6))
 
-        for name, rect in self.buttons.items():
-            is_hover = rect.collidepoint(mouse_x, mouse_y)
-            if is_hover:
-                self.hovered = name
-            ctx.screen.draw.filled_rect(rect, self.color_hover if is_hover else self.color_btn)
+    def _on_progress(self, loaded, total):
+        self.load_progress = loaded / total
 
-            label = "Play Game" if name == "play" else "Exit Game"
-            ctx.screen.draw.text(label, center=rect.center, fontsize=32, color=self.color_text)
+    def on_mouse_move(self, pos, ctx):
+        for w in self.ui.hover(pos):
+            self.invalidate(w.rect)
 
     def on_mouse_down(self, pos, button, ctx):
-        if button != 1:
-            return
-        x, y = pos
-        if self.buttons["play"].collidepoint(x, y):
-            from pgzero import music
-
-            music.stop()
-            self._manager.change("play")
-            return
-        if self.buttons["exit"].collidepoint(x, y):
-            sys.exit(0)
+        if button == 1:
+            self.ui.click(pos)
+
+    def on_mouse_up(self, pos, button, ctx):
+        for w in self.ui.release(pos):
+            self.invalidate(w.rect)
+
+    def _play(self):
+        from pgzero import music
+
+        music.stop()
+        assets.wait()
+        self._manager.change("play")
+
+    def _exit(self):
+        sys.exit(0)
 
     def update(self, dt, ctx):
-        ctx.mouse_pos = getattr(ctx, "mouse_pos", (0, 0))
+        assets.preload(self._on_progress)
+        pct = int(self.load_progress * 100)
+        if pct != self._shown_pct:
+            self._shown_pct = pct
+            self.invalidate(self.loading_rect)
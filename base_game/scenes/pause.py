@@ -1,134 +1,119 @@
 import sys
 
-from pygame import Rect
-
+from .. import config
+from ..systems.assets import assets
+from ..ui.widgets import Button, IconButton, Label, Panel
 from .base import BaseScene
 
 
 class PauseScene(BaseScene):
-    def on_enter(self, ctx=None):
+    DIRTY_RECTS = True
+    BACKDROP = {"dim": 80, "blur": 4}
+    TEXT_COLOR = (255, 255, 255)
+    BUTTON = {"fontsize": 32, "color": (70, 70, 70), "hover": (110, 110, 110)}
+    LABELS = {
+        "resume": "Resume",
+        "restart": "Restart",
+        "menu": "Back to main menu",
+        "exit": "Exit Game",
+    }
+
+    def prepare(self):
         self.btn_w, self.btn_h = 240, 60
-        self.color_btn = (70, 70, 70)
-        self.color_hover = (110, 110, 110)
-        self.color_text = (255, 255, 255)
-        self.hovered = None
+        self.btn_size = 36
+        self.btn_margin = 30
+        self.btn_mute_img = assets.image("ui/mute")
+        self.btn_unmute_img = assets.image("ui/unmute")
+
+        self.ui = Panel(self._layout)
+        self.title = self.ui.add(Label("Game Paused", 64, self.TEXT_COLOR, (2, 2)))
+        self.buttons = {
+            name: self.ui.add(Button(label, getattr(self, f"_{name}"), **self.BUTTON))
+            for name, label in self.LABELS.items()
+        }
+        self.mute_button = self.ui.add(
+            IconButton(self.btn_mute_img, self._toggle_mute, hit_pad=-6, dynamic=True)
+        )
 
-        from pgzero import music
-        from pgzero.loaders import images as pgz_images
+    def _layout(self, ui, sw, sh):
+        center_x = sw // 2
+        start_y = sh // 2 - 60
+        spacing = 80
+        self.title.place(center=(center_x, sh // 2 - 160))
+        for i, button in enumerate(self.buttons.values()):
+            button.place(
+                (center_x - self.btn_w // 2, start_y + spacing * i, self.btn_w, self.btn_h)
+            )
+        self.mute_button.place(topleft=(sw - self.btn_size - self.btn_margin, self.btn_margin))
 
-        play_scene = self._manager._scenes.get("play")
-        if play_scene and ctx:
-            play_scene.show_pause_button = False
-            play_scene.show_mute_button = False
+    def on_enter(self):
+        self.play_scene = self._manager.below(self)
 
-            ctx.screen.clear()
-            play_scene.draw(ctx)
+        from pgzero import music
 
-            if not play_scene.music_muted:
-                music.set_volume(music.get_volume() * 0.5)
+        if self.play_scene and not self.play_scene.music_muted:
+            music.set_volume(music.get_volume() * 0.5)
 
-        self.btn_mute_img = pgz_images.load("ui/mute")
-        self.btn_unmute_img = pgz_images.load("ui/unmute")
-        self.btn_size = 36
-        self.btn_margin = 30
+        self.ui.reset()
+        self.mute_button.visible = self.play_scene is not None
+        self._sync_mute()
+        self.ui.layout(config.WIDTH, config.HEIGHT)
+
+    def _sync_mute(self):
+        if self.play_scene is not None:
+            muted = self.play_scene.music_muted
+            self.mute_button.set_image(self.btn_unmute_img if muted else self.btn_mute_img)
 
     def draw(self, ctx):
-        sw, sh = ctx.screen.width, ctx.screen.height
-        center_x = sw // 2
-        center_y = sh // 2
-
-        ctx.screen.draw.text(
-            "Game Paused",
-            center=(center_x, center_y - 160),
-            fontsize=64,
-            color=self.color_text,
-            shadow=(2, 2),
-        )
-        play_scene = self._manager._scenes.get("play")
-        if play_scene:
-            btn_img = self.btn_unmute_img if play_scene.music_muted else self.btn_mute_img
-            btn_x = ctx.screen.width - self.btn_size - self.btn_margin
-            btn_y = self.btn_margin
-            ctx.screen.blit(btn_img, (btn_x, btn_y))
-            self.mute_button_rect = Rect(btn_x, btn_y, self.btn_size, self.btn_size)
-        else:
-            self.mute_button_rect = None
-        spacing = 80
-        start_y = center_y - 60
-        buttons = {
-            "resume": Rect(center_x - self.btn_w // 2, start_y, self.btn_w, self.btn_h),
-            "restart": Rect(center_x - self.btn_w // 2, start_y + spacing, self.btn_w, self.btn_h),
-            "menu": Rect(center_x - self.btn_w // 2, start_y + spacing * 2, self.btn_w, self.btn_h),
-            "exit": Rect(center_x - self.btn_w // 2, start_y + spacing * 3, self.btn_w, self.btn_h),
-        }
-        self.buttons = buttons
-
-        mouse_x, mouse_y = getattr(ctx, "mouse_pos", (0, 0))
-        self.hovered = None
-
-        for name, rect in self.buttons.items():
-            is_hover = rect.collidepoint(mouse_x, mouse_y)
-            if is_hover:
-                self.hovered = name
-            ctx.screen.draw.filled_rect(rect, self.color_hover if is_hover else self.color_btn)
-            label = {
-                "resume": "Resume",
-                "restart": "Restart",
-                "menu": "Back to main menu",
-                "exit": "Exit Game",
-            }[name]
-            ctx.screen.draw.text(label, center=rect.center, fontsize=32, color=self.color_text)
+        self.ui.layout(ctx.screen.width, ctx.screen.height)
+        ctx.screen.clear()
+        if self._manager.backdrop is not None:
+            ctx.screen.blit(self._manager.backdrop, (0, 0))
+        self.ui.draw_static(ctx.screen)
+
+    def draw_dynamic(self, ctx, area):
+        self.ui.draw_dynamic(ctx.screen, area)
+
+    def on_mouse_move(self, pos, ctx):
+        for w in self.ui.hover(pos):
+            self.invalidate(w.rect)
 
     def on_mouse_down(self, pos, button, ctx):
-        if button != 1:
-            return
-        if (
-            hasattr(self, "mute_button_rect")
-            and self.mute_button_rect
-            and self.mute_button_rect.collidepoint(pos)
-        ):
-            play_scene = self._manager._scenes.get("play")
-            if play_scene:
-                play_scene.music_muted = not play_scene.music_muted
-                from pgzero import music
-
-                if play_scene.music_muted:
-                    music.set_volume(0.0)
-                else:
-                    music.set_volume(
-                        play_scene.BASE_VOLUME if hasattr(play_scene, "BASE_VOLUME") else 0.09
-                    )
-            return
-        x, y = pos
-        if not hasattr(self, "buttons"):
-            return
-        if self.buttons["resume"].collidepoint(x, y):
-            self._manager.change("play", resume=True)
-            return
-        if self.buttons["restart"].collidepoint(x, y):
-
-            play_scene = self._manager._scenes.get("play")
-            was_muted = play_scene.music_muted if play_scene else False
-
-            from pgzero import music
-
-            music.stop()
-
-            self._manager.change("play", muted=was_muted)
-            return
-        if self.buttons["menu"].collidepoint(x, y):
-            from pgzero import music
-
-            music.stop()
-
-            play_scene = self._manager._scenes.get("play")
-            if play_scene:
-                play_scene._loop_music = False
-
-            self._manager.change("menu")
-            return
-        if self.buttons["exit"].collidepoint(x, y):
-            sys.exit(0)
-
-    def update(self, dt, ctx):
-        ctx.mouse_pos = getattr(ctx, "mouse_pos", (0, 0))
+        if button == 1:
+            self.ui.click(pos)
+
+    def on_mouse_up(self, pos, button, ctx):
+        for w in self.ui.release(pos):
+            self.invalidate(w.rect)
+
+    def _toggle_mute(self):
+        play_scene = self.play_scene
+        play_scene.music_muted = not play_scene.music_muted
+        from pgzero import music
+
+        if play_scene.music_muted:
+            music.set_volume(0.0)
+        else:
+            music.set_volume(getattr(play_scene, "BASE_VOLUME", 0.09))
+        self._sync_mute()
+        self.invalidate(self.mute_button.rect)
+
+    def _resume(self):
+        self._manager.pop()
+
+    def _restart(self):
+        was_muted = self.play_scene.music_muted if self.play_scene else False
+
+        from pgzero import music
+
+        music.stop()
+        self._manager.change("play", muted=was_muted)
+
+    def _menu(self):
+        from pgzero import music
+
+        music.stop()
+        self._manager.change("menu")
+
+    def _exit(self):
+        sys.exit(0)
@@ -1,31 +1,118 @@
 import os
-import random
+from types import SimpleNamespace
 
+import pygame
 from pgzero import music
-from pgzero.loaders import images as pgz_images
+from pgzero.screen import Screen
 from pygame import Rect
 
 from ..entities.armadillo import ArmadilloEnemy
+from ..entities.horde import Horde
 from ..entities.plant import PlantEnemy
 from ..entities.player import Player
 from ..entities.skeleton import SkeletonEnemy
 from ..level import tiles
+from .. import config
+from ..level.fog import FogOfWar
+from ..level.lighting import Lighting
 from ..level.procgen import generate_world
+from ..systems import sprites
+from ..systems.ai_scheduler import DUE, AIScheduler
+from ..systems.assets import assets
+from ..systems.events import HIT_PLAYER, SPAWN_PROJECTILE, EventBuffer
+from ..systems.depth import DepthList
+from ..systems.render import LAYER_ACTORS, RenderQueue
+from ..systems.rng import RngStreams
+from ..systems.steering import batch_skeleton_steer, neighbour_cells
+from ..systems.timers import timers
+from ..systems.trace import tracer
+from ..ui import text
 from ..ui.healthbar import HealthBar
+from ..ui.hud import HudLayer
+from ..ui.minimap import Minimap
+from ..ui.widgets import IconButton, Panel
 from .base import BaseScene
 
 
+_SPAN_NAMES = {}
+
+
+def _update_span_name(e):
+    cls = type(e)
+    name = _SPAN_NAMES.get(cls)
+    if name is None:
+        name = _SPAN_NAMES[cls] = f"{cls.__name__}.update"
+    return name
+
+
 class PlayScene(BaseScene):
     SPEED = 160.0
     BASE_VOLUME = 0.09
     DEATH_FADE_TIME = 0.6
+    HORDE_CHANCE = 0.0
+    HORDE_SIZE = 120
+    CULL_MARGIN = 64
+    FOG_RADIUS = 4
+    MINIMAP_POS = (10, 10)
+    PLAYER_LIGHT = (150, (120, 110, 90))
+    BOLT_LIGHT = (28, (110, 110, 40))
+    SEED_LIGHT = (24, (40, 120, 30))
+    NEXT_SCENES = ("pause", "game_over", "you_win")
+
+    def prepare(self):
+        self.btn_mute_img = assets.image("ui/mute")
+        self.btn_unmute_img = assets.image("ui/unmute")
+        self.btn_pause_img = assets.image("ui/pause")
+        sprites.table(sprites.PLAYER_BOLT)
+        sprites.table(sprites.SEED)
 
-    def on_enter(self, muted=False):
+        self.btn_size = 36
+        self.btn_margin = 35
+        self.btn_offset_y = -4
+        self.hud = Panel(self._layout_hud)
+        self.mute_button = self.hud.add(
+            IconButton(self.btn_mute_img, self._toggle_mute, hit_pad=-6)
+        )
+        self.pause_button = self.hud.add(
+            IconButton(self.btn_pause_img, lambda: self._manager.push("pause"), hit_pad=-6)
+        )
+
+    def _paint_hud(self, ctx):
+        self.minimap.draw(ctx.screen, self.MINIMAP_POS, self.current_room_id)
+        self.hud.draw(ctx.screen)
+        self.hud_hp.draw(ctx, self.player_ent.hp, self.player_ent.max_hp)
+        bar = self.hud_hp
+        digits = text.glyphs(20, (235, 235, 235), text.DIGITS + "/")
+        digits.draw(
+            ctx.screen,
+            f"{self.rooms_cleared}/{len(self.room_state)}",
+            midleft=(bar.x + bar.width + 10, ctx.screen.height - bar.margin - bar.height // 2),
+        )
+
+    def _layout_hud(self, hud, sw, sh):
+        btn_x = sw - self.btn_size - self.btn_margin
+        btn_y = self.btn_margin + self.btn_offset_y
+        self.mute_button.place(topleft=(btn_x, btn_y))
+        self.pause_button.place(topleft=(btn_x - self.btn_size - 25, btn_y))
+
+    def on_enter(self, muted=False, seed=None):
+        timers.reset()
+        self.rng = RngStreams(seed)
+        self.seed = self.rng.seed
         self.room = generate_world(
-            seed=None, target_rooms=6, first_size=(20, 15), min_size=15, max_size=30
+            target_rooms=6, first_size=(20, 15), min_size=15, max_size=30, rng=self.rng.worldgen
         )
 
         self.room_state = [m["state"] for m in self.room.rooms_meta]
+        self.rooms_cleared = self.room_state.count("cleared")
+        self.minimap = Minimap(self.room)
+        self.lighting = Lighting(self.room)
+        self.fog = FogOfWar.for_room(self.room)
+        self.fog.reveal_rect(self.room.rooms_meta[self.room.start_room_id]["rect_g"])
+        self._fog_tile = None
+        for rid, state in enumerate(self.room_state):
+            if state != "unvisited":
+                self.minimap.reveal(rid, state)
         self.current_room_id = None
 
         self.door_state = {}
@@ -34,6 +121,11 @@ class PlayScene(BaseScene):
         self.room.rect_hits_blocker = self._rect_hits_blocker
 
         self.active_enemies = []
+        self.horde = Horde(rng=self.rng.ai)
+        self.render_queue = RenderQueue()
+        self.cull_stats = {"drawn": 0, "culled": 0}
+        self.ai = AIScheduler()
+        self.events = EventBuffer()
 
         self.pending_lock = None
         self.lock_delay_default = 0.15
@@ -48,6 +140,8 @@ class PlayScene(BaseScene):
         size = max(tiles.TILE - 4, 8)
 
         self.player_ent = Player(sx, sy, size=size, speed=self.SPEED)
+        self.draw_list = DepthList()
+        self.draw_list.add(self.player_ent)
         self.player_ent.set_sfx_muted(bool(muted))
         self.player = self.player_ent.rect
 
@@ -60,7 +154,9 @@ class PlayScene(BaseScene):
         self.music_tracks = [
             f for f in os.listdir(music_folder) if f.lower().endswith((".ogg", ".mp3", ".wav"))
         ]
-        self.music_index = random.randrange(len(self.music_tracks)) if self.music_tracks else 0
+        self.music_index = 0
+        if self.music_tracks:
+            self.music_index = self.rng.fx.randrange(len(self.music_tracks))
         self.music_muted = muted
 
         if self.music_tracks:
@@ -72,30 +168,14 @@ class PlayScene(BaseScene):
             except Exception as e:
                 print("Music load failed:", e)
 
-        self.btn_mute_img = pgz_images.load("ui/mute")
-        self.btn_unmute_img = pgz_images.load("ui/unmute")
-        self.btn_size = 36
-        self.btn_margin = 35
-
-        self.show_pause_button = True
-        self.show_mute_button = True
-
         self.pending_pause = False
 
-        self.btn_pause_img = pgz_images.load("ui/pause")
-        self.btn_pause_size = 36
-        self.btn_pause_margin = 10
-
-        self.btn_offset_y = -4
-        self.btn_offset_x = 0
-
-        self.hitbox_offset_x = +15
-        self.hitbox_offset_y = +15
-
-        self.hitbox_expand_x = 8
-        self.hitbox_expand_y = 8
+        self.hud.reset()
+        self.mute_button.set_image(self.btn_unmute_img if muted else self.btn_mute_img)
+        self.hud.layout(config.WIDTH, config.HEIGHT)
 
         self.hud_hp = HealthBar()
+        self.hud_layer = HudLayer(self._paint_hud)
 
         self.death_stage = None
         self.death_t = 0.0
@@ -132,6 +212,8 @@ class PlayScene(BaseScene):
         return max(0, min(depths))
 
     def update(self, dt, ctx):
+        timers.advance(dt)
+
         vx = (-self.SPEED if ctx.keyboard[ctx.keys.A] else 0.0) + (
             self.SPEED if ctx.keyboard[ctx.keys.D] else 0.0
         )
@@ -152,16 +234,22 @@ class PlayScene(BaseScene):
         gy = self.player.centery // tiles.TILE
         rid = self._room_id_at(gx, gy)
 
+        if (gx, gy) != self._fog_tile:
+            self._fog_tile = (gx, gy)
+            self.fog.reveal_radius(gx, gy, self.FOG_RADIUS)
+
         if rid != self.current_room_id:
             self.current_room_id = rid
+            if rid is not None:
+                self.fog.reveal_rect(self.room.rooms_meta[rid]["rect_g"])
             if rid is not None and self.room_state[rid] == "unvisited":
                 self.pending_lock = {"rid": rid, "timer": self.lock_delay_default}
-                self.room_state[rid] = "arming"
+                self._set_room_state(rid, "arming")
 
         if self.pending_lock:
             ar = self.pending_lock
             if self.current_room_id != ar["rid"]:
-                self.room_state[ar["rid"]] = "unvisited"
+                self._set_room_state(ar["rid"], "unvisited")
                 self.pending_lock = None
             else:
                 ar["timer"] -= dt
@@ -171,7 +259,7 @@ class PlayScene(BaseScene):
                     for key in self.room.rooms_meta[ar["rid"]]["doors"]:
                         self._set_door_open(key, False)
                     self._spawn_enemies_for_room(ar["rid"])
-                    self.room_state[ar["rid"]] = "locked"
+                    self._set_room_state(ar["rid"], "locked")
                     self.pending_lock = None
 
         shoot_x = int(ctx.keyboard[ctx.keys.RIGHT]) - int(ctx.keyboard[ctx.keys.LEFT])
@@ -179,6 +267,7 @@ class PlayScene(BaseScene):
         proj = self.player_ent.try_shoot(shoot_x, shoot_y)
         if proj:
             self.projectiles.append(proj)
+            self.draw_list.add(proj)
 
         new_proj = []
         for p in self.projectiles:
@@ -186,6 +275,7 @@ class PlayScene(BaseScene):
             if not p.alive:
                 continue
             if self._rect_hits_wall(p.rect):
+                p.alive = False
                 continue
 
             team = getattr(p, "team", "player")
@@ -197,12 +287,16 @@ class PlayScene(BaseScene):
                         e.take_damage(p.dmg)
                         hit = True
                         break
+                if not hit and self.horde.hit(p.rect, p.dmg):
+                    hit = True
                 if hit:
+                    p.alive = False
                     continue
             else:
                 if p.rect.colliderect(self.player):
                     if getattr(self.player_ent, "take_damage", None):
                         self.player_ent.take_damage(getattr(p, "dmg", 1))
+                    p.alive = False
                     continue
 
             new_proj.append(p)
@@ -212,14 +306,14 @@ class PlayScene(BaseScene):
 
         rid = self.current_room_id
         if rid is not None and self.room_state[rid] == "locked":
-            if not self.active_enemies:
+            if not self.active_enemies and not len(self.horde):
                 for key in self.room.rooms_meta[rid]["doors"]:
                     self._set_door_open(key, True)
-                self.room_state[rid] = "cleared"
+                self._set_room_state(rid, "cleared")
                 if (not self._you_win_fired) and (self.death_stage is None):
                     if all(state == "cleared" for state in self.room_state):
                         self._you_win_fired = True
-                        self._manager.change("you_win", muted=self.music_muted)
+                        self._manager.push("you_win", muted=self.music_muted)
 
         if getattr(self, "_loop_music", False):
             try:
@@ -229,7 +323,7 @@ class PlayScene(BaseScene):
             except Exception:
                 pass
         if self.pending_pause:
-            self._manager.change("pause")
+            self._manager.push("pause")
             self.pending_pause = False
 
         if self.death_stage is not None:
@@ -246,21 +340,23 @@ class PlayScene(BaseScene):
         return tiles.is_solid(tid) or tiles.Tile(tid) == tiles.Tile.VOID
 
     def _spawn_enemies_for_room(self, rid):
-        import random
-
+        rng = self.rng.spawn
         inner = self.room.rooms_meta[rid]["rect_inner_g"]
         ts = tiles.TILE
 
         placed_rects = []
 
+        def _far_from_player(rect: Rect) -> bool:
+            pcx, pcy = self.player.centerx, self.player.centery
+            ecx, ecy = rect.centerx, rect.centery
+            return (pcx - ecx) ** 2 + (pcy - ecy) ** 2 >= (3 * ts) ** 2
+
         def _ok_pos(rect: Rect) -> bool:
 
             if self._rect_hits_wall(rect):
                 return False
 
-            pcx, pcy = self.player.centerx, self.player.centery
-            ecx, ecy = rect.centerx, rect.centery
-            if (pcx - ecx) ** 2 + (pcy - ecy) ** 2 < (3 * ts) ** 2:
+            if not _far_from_player(rect):
                 return False
 
             for r in placed_rects:
@@ -268,29 +364,32 @@ class PlayScene(BaseScene):
                     return False
             return True
 
-        def _try_place(w: int, h: int):
+        def _try_place(w: int, h: int, exclusive=True):
             for _ in range(64):
-                gx = random.randint(inner.left, inner.right - 1)
-                gy = random.randint(inner.top, inner.bottom - 1)
+                gx = rng.randint(inner.left, inner.right - 1)
+                gy = rng.randint(inner.top, inner.bottom - 1)
                 px = gx * ts + (ts - w) // 2
                 py = gy * ts + (ts - h) // 2
                 probe = Rect(px, py, w, h)
-                if _ok_pos(probe):
+                if not exclusive:
+                    if not self._rect_hits_wall(probe) and _far_from_player(probe):
+                        return px, py
+                elif _ok_pos(probe):
                     placed_rects.append(probe)
                     return px, py
             return None
 
-        n_skel = random.randint(2, 4)
+        n_skel = rng.randint(2, 4)
         for _ in range(n_skel):
             pos = _try_place(24, 24)
             if pos:
-                self.active_enemies.append(SkeletonEnemy(*pos))
+                self._add_actor(SkeletonEnemy(*pos, rng=self.rng.ai))
 
-        n_arm = random.randint(2, 3)
+        n_arm = rng.randint(2, 3)
         for _ in range(n_arm):
             pos = _try_place(22, 22)
             if pos:
-                self.active_enemies.append(ArmadilloEnemy(*pos))
+                self._add_actor(ArmadilloEnemy(*pos, rng=self.rng.ai))
         max_plants = 4
 
         def _plant_wall_slots():
@@ -327,7 +426,7 @@ class PlayScene(BaseScene):
             return slots
 
         plant_slots = _plant_wall_slots()
-        random.shuffle(plant_slots)
+        rng.shuffle(plant_slots)
 
         placed_plants = 0
         for px, py, facing in plant_slots:
@@ -336,32 +435,56 @@ class PlayScene(BaseScene):
             probe = Rect(px, py, 24, 24)
             if not _ok_pos(probe):
                 continue
-            self.active_enemies.append(PlantEnemy(px, py, facing=facing))
+            self._add_actor(PlantEnemy(px, py, facing=facing, rng=self.rng.ai))
             placed_rects.append(probe)
             placed_plants += 1
+
+        if self.HORDE_CHANCE > 0.0 and rng.random() < self.HORDE_CHANCE:
+            for i in range(self.HORDE_SIZE):
+                if i % 3 == 2:
+                    pos = _try_place(22, 22, exclusive=False)
+                    if pos:
+                        self.horde.spawn_armadillo(*pos)
+                else:
+                    pos = _try_place(24, 24, exclusive=False)
+                    if pos:
+                        self.horde.spawn_skeleton(*pos)
+
         self.room._enemy_rects = [e.rect for e in self.active_enemies]
 
     def _update_enemies(self, dt):
         self.room._enemy_rects = [e.rect for e in self.active_enemies]
 
-        new_list = []
-        for e in self.active_enemies:
-            evt = e.update(dt, self.room, self.player)
-            if evt:
-                if evt[0] == "HIT_PLAYER":
-                    dmg = int(evt[1])
-                    if getattr(self.player_ent, "take_damage", None):
-                        self.player_ent.take_damage(dmg)
-                    if self.player_ent.hp <= 0:
-                        self._trigger_game_over()
-                        return
-                elif evt[0] == "SPAWN_ENEMY_PROJECTILE":
-                    self.projectiles.append(evt[1])
+        view = Rect(*self._camera(config.WIDTH, config.HEIGHT), config.WIDTH, config.HEIGHT)
+        plan = self.ai.plan(self.active_enemies, dt, view, self.player)
+        skeletons = [
+            e for e, _acc, tier in plan if tier <= DUE and isinstance(e, SkeletonEnemy)
+        ]
+        with tracer.span("steering.batch"):
+            self.room._steer_cells = neighbour_cells(r.center for r in self.room._enemy_rects)
+            batch_skeleton_steer(
+                skeletons, self.room._steer_cells, self.player, SkeletonEnemy.ATTACK_RANGE
+            )
+
+        events = self.events
+        events.clear()
+        for e, edt in self.ai.run(plan):
+            with tracer.span(_update_span_name(e)):
+                e.update(edt, self.room, self.player, events)
+        with tracer.span("Horde.update"):
+            self.horde.update(dt, self.room, self.player, events, self.door_blockers.values())
+
+        if not self._dispatch_events(events):
+            return
 
+        alive = []
+        for e in self.active_enemies:
             if e.alive:
-                new_list.append(e)
-
-        self.active_enemies = new_list
+                alive.append(e)
+            else:
+                e.release()
+        self.active_enemies = alive
+        self.horde.compact()
         self.room._enemy_rects = [e.rect for e in self.active_enemies]
 
         for _ in range(2):
@@ -440,6 +563,24 @@ class PlayScene(BaseScene):
 
         self.room._enemy_rects = [e.rect for e in self.active_enemies]
 
+    def _dispatch_events(self, events):
+        codes, values, refs = events.codes, events.values, events.refs
+        for i in range(events.count):
+            code = codes[i]
+            if code == HIT_PLAYER:
+                self.player_ent.take_damage(values[i])
+                if self.player_ent.hp <= 0:
+                    self._trigger_game_over()
+                    return False
+            elif code == SPAWN_PROJECTILE:
+                self.projectiles.append(refs[i])
+                self.draw_list.add(refs[i])
+        return True
+
+    def _add_actor(self, e):
+        self.active_enemies.append(e)
+        self.draw_list.add(e)
+
     def _move_and_collide(self, r, dx: int, dy: int):
         ts = tiles.TILE
 
@@ -533,6 +674,12 @@ class PlayScene(BaseScene):
         self.door_state[key] = bool(open_flag)
         self.door_blockers[key] = None if open_flag else self._make_blocker(key)
 
+    def _set_room_state(self, rid, state):
+        self.room_state[rid] = state
+        if state == "cleared":
+            self.rooms_cleared += 1
+        self.minimap.reveal(rid, state)
+
     def _room_id_at(self, gx, gy):
         for m in self.room.rooms_meta:
             if m["rect_inner_g"].collidepoint(gx, gy):
@@ -545,6 +692,9 @@ class PlayScene(BaseScene):
                 return br
         return None
 
+    def on_exit(self):
+        self._loop_music = False
+
     def on_resume(self):
         try:
             if not self.music_muted:
@@ -553,107 +703,97 @@ class PlayScene(BaseScene):
         except Exception:
             pass
 
-        self.show_pause_button = True
-        self.show_mute_button = True
+        self.hud.reset()
+        self.mute_button.set_image(self.btn_unmute_img if self.music_muted else self.btn_mute_img)
 
-    def draw(self, ctx):
-        ctx.screen.clear()
-        sw, sh = ctx.screen.width, ctx.screen.height
+    def _camera(self, sw, sh):
         world_w = len(self.room.grid[0]) * tiles.TILE
         world_h = len(self.room.grid) * tiles.TILE
 
         cam_x = max(0, min(self.player.centerx - sw // 2, world_w - sw))
         cam_y = max(0, min(self.player.centery - sh // 2, world_h - sh))
+        return cam_x, cam_y
 
-        self.room.draw(ctx, cam_offset=(-cam_x, -cam_y))
-
-        actors = [*self.active_enemies, self.player_ent]
-        actors.sort(key=lambda obj: obj.rect.bottom)
-
-        for obj in actors:
-            obj.draw(ctx, cam_x, cam_y)
+    def draw(self, ctx):
+        self._draw_world(ctx)
+        self.hud.layout(ctx.screen.width, ctx.screen.height)
+        self.hud_layer.draw(
+            ctx.screen,
+            self.player_ent.hp,
+            self.player_ent.max_hp,
+            self.music_muted,
+            self.rooms_cleared,
+            self.minimap.key(self.current_room_id),
+        )
+        self.minimap.draw_marker(ctx.screen, self.MINIMAP_POS, self.player.center)
 
-        btn_x = ctx.screen.width - self.btn_size - self.btn_margin + self.btn_offset_x
-        btn_y = self.btn_margin + self.btn_offset_y
+        if self.death_stage in ("fade", "menu"):
+            self._draw_death_overlay(ctx)
 
-        if self.show_mute_button:
-            btn_img = self.btn_unmute_img if self.music_muted else self.btn_mute_img
-            ctx.screen.blit(btn_img, (btn_x, btn_y))
+    def _draw_world(self, ctx):
+        ctx.screen.clear()
+        cam_x, cam_y = self._camera(ctx.screen.width, ctx.screen.height)
+        queue = self.render_queue
+        queue.begin(ctx.screen.width, ctx.screen.height)
 
-        if self.show_pause_button:
-            pause_x = btn_x - self.btn_pause_size - 25 + self.btn_offset_x
-            pause_y = btn_y
-            ctx.screen.blit(self.btn_pause_img, (pause_x, pause_y))
+        self.room.draw(ctx, cam_offset=(-cam_x, -cam_y), queue=queue)
 
-        self.hud_hp.draw(ctx, self.player_ent.hp, self.player_ent.max_hp)
+        m = self.CULL_MARGIN
+        view = Rect(cam_x - m, cam_y - m, ctx.screen.width + 2 * m, ctx.screen.height + 2 * m)
+        visible = view.colliderect
 
-        if self.death_stage in ("fade", "menu"):
-            self._draw_death_overlay(ctx)
+        drawn = self.horde.draw(queue.context(LAYER_ACTORS, run="horde"), cam_x, cam_y)
+        culled = len(self.horde) - drawn
 
+        actors = queue.context(LAYER_ACTORS, run="actors")
+        self.draw_list.update()
+        for obj in self.draw_list.items:
+            if not visible(obj.rect):
+                culled += 1
+                continue
+            drawn += 1
+            actors.screen.depth = obj.rect.bottom
+            obj.draw(actors, cam_x, cam_y)
+
+        self.cull_stats["drawn"] = drawn
+        self.cull_stats["culled"] = culled
+        tracer.counter("cull", drawn=drawn, culled=culled)
+        self.lighting.draw(queue, cam_x, cam_y, self._lights())
+        self.fog.draw(queue, cam_x, cam_y)
+        queue.flush(ctx.screen.surface)
+
+    def _lights(self):
+        lights = [(self.player.centerx, self.player.centery) + self.PLAYER_LIGHT]
         for p in self.projectiles:
-            if getattr(p, "sprite", None):
-                img = pgz_images.load(p.sprite)
-                ctx.screen.blit(img, (p.rect.x - cam_x, p.rect.y - cam_y))
-            else:
-                ctx.screen.draw.filled_rect(p.rect.move(-cam_x, -cam_y), (220, 220, 60))
+            glow = self.BOLT_LIGHT if p.team == "player" else self.SEED_LIGHT
+            lights.append((p.rect.centerx, p.rect.centery) + glow)
+        return lights
+
+    def snapshot(self, surface):
+        frame = pygame.Surface(surface.get_size())
+        self._draw_world(SimpleNamespace(screen=Screen(frame)))
+        return frame
 
     def on_mouse_down(self, pos, button, ctx):
         if button != 1:
             return
-        bx, by = pos
         if self.death_stage == "menu":
             if self._click_death_menu(pos, ctx):
                 return
+        self.hud.click(pos)
 
-        btn_x = ctx.screen.width - self.btn_size - self.btn_margin + self.btn_offset_x
-        btn_y = self.btn_margin + self.btn_offset_y
-
-        mute_hit = (
-            btn_x + self.hitbox_offset_x - self.hitbox_expand_x
-            <= bx
-            <= btn_x + self.btn_size + self.hitbox_offset_x + self.hitbox_expand_x
-            and btn_y + self.hitbox_offset_y - self.hitbox_expand_y
-            <= by
-            <= btn_y + self.btn_size + self.hitbox_offset_y + self.hitbox_expand_y
-        )
-
-        if mute_hit:
-            self.show_mute_button = False
-            ctx.screen.clear()
-            self.draw(ctx)
-
-            self.music_muted = not self.music_muted
-            if self.music_muted:
-                music.set_volume(0.0)
-            else:
-                music.set_volume(self.BASE_VOLUME)
-            if getattr(self, "player_ent", None):
-                self.player_ent.set_sfx_muted(self.music_muted)
-            self.show_mute_button = True
-            ctx.screen.clear()
-            self.draw(ctx)
-            return
-
-        pause_x = btn_x - self.btn_pause_size - 25 + self.btn_offset_x
-        pause_y = btn_y
-
-        pause_hit = (
-            pause_x + self.hitbox_offset_x - self.hitbox_expand_x
-            <= bx
-            <= pause_x + self.btn_pause_size + self.hitbox_offset_x + self.hitbox_expand_x
-            and pause_y + self.hitbox_offset_y - self.hitbox_expand_y
-            <= by
-            <= pause_y + self.btn_pause_size + self.hitbox_offset_y + self.hitbox_expand_y
-        )
-
-        if pause_hit:
-            self.show_pause_button = False
-
-            ctx.screen.clear()
-            self.draw(ctx)
+    def on_mouse_up(self, pos, button, ctx):
+        self.hud.release(pos)
 
-            self._manager.change("pause", ctx)
-            return
+    def _toggle_mute(self):
+        self.music_muted = not self.music_muted
+        if self.music_muted:
+            music.set_volume(0.0)
+        else:
+            music.set_volume(self.BASE_VOLUME)
+        if getattr(self, "player_ent", None):
+            self.player_ent.set_sfx_muted(self.music_muted)
+        self.mute_button.set_image(self.btn_unmute_img if self.music_muted else self.btn_mute_img)
 
     def _sign(self, v: float) -> int:
         return 1 if v > 0 else (-1 if v < 0 else 0)
@@ -710,25 +850,8 @@ class PlayScene(BaseScene):
                 e.rect.x += dx
                 return
 
-    def _draw_hud(self, ctx):
-        bar_w, bar_h = 160, 12
-        x, y = 10, ctx.screen.height - bar_h - 10
-
-        ctx.screen.draw.rect(Rect(x - 1, y - 1, bar_w + 2, bar_h + 2), (15, 15, 15))
-        ctx.screen.draw.filled_rect(Rect(x, y, bar_w, bar_h), (40, 40, 40))
-
-        p = 0.0
-        if self.player_ent.max_hp > 0:
-            p = max(0.0, min(1.0, self.player_ent.hp / self.player_ent.max_hp))
-
-        fill_w = max(0, int((bar_w - 2) * p))
-        ctx.screen.draw.filled_rect(Rect(x + 1, y + 1, fill_w, bar_h - 2), (60, 200, 80))
-
     def _trigger_game_over(self):
         if self._game_over_fired:
             return
         self._game_over_fired = True
-        try:
-            self._manager.change("game_over", muted=self.music_muted)
-        except TypeError:
-            self._manager.change("game_over")
+        self._manager.push("game_over", muted=self.music_muted)
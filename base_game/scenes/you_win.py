@@ -1,4 +1,5 @@
-from pygame import Rect
+from .. import config
+from ..ui.widgets import Button, Label, Panel
 from .base import BaseScene
 try:
     from pgzero import music
@@ -6,9 +7,32 @@ except Exception:
     music = None
 
 class YouWinScene(BaseScene):
+    DIRTY_RECTS = True
+    BUTTON = {
+        "fontsize": 28,
+        "color": (38, 38, 38),
+        "text_color": (235, 235, 235),
+        "border": (220, 220, 220),
+    }
+
+    def prepare(self):
+        self.ui = Panel(self._layout, color=(0, 0, 0))
+        self.title = self.ui.add(Label("YOU WIN!", 56, (90, 220, 90)))
+        self.btn_again = self.ui.add(Button("Play Again", self._play_again, **self.BUTTON))
+        self.btn_menu = self.ui.add(Button("Main Menu", self._to_menu, **self.BUTTON))
+
+    def _layout(self, ui, sw, sh):
+        W, H, GAP = 220, 48, 18
+        x = (sw - W) // 2
+        y0 = sh // 2 - H // 2
+        self.title.place(center=(sw//2, sh//2 - 80))
+        self.btn_again.place((x, y0, W, H))
+        self.btn_menu.place((x, y0 + H + GAP, W, H))
+
     def on_enter(self, muted=False):
         self.muted = bool(muted)
-        self._btn_cache = None
+        self.ui.reset()
+        self.ui.layout(config.WIDTH, config.HEIGHT)
         try:
             if music:
                 music.stop()
@@ -19,26 +43,24 @@ class YouWinScene(BaseScene):
         pass
 
     def draw(self, ctx):
-        sw, sh = ctx.screen.width, ctx.screen.height
+        self.ui.layout(ctx.screen.width, ctx.screen.height)
         ctx.screen.clear()
-        ctx.screen.draw.filled_rect(Rect(0, 0, sw, sh), (0, 0, 0))
+        self.ui.draw_static(ctx.screen)
 
-        ctx.screen.draw.text("YOU WIN!",
-                             center=(sw//2, sh//2 - 80),
-                             fontsize=56, color=(90, 220, 90))
+    def draw_dynamic(self, ctx, area):
+        self.ui.draw_dynamic(ctx.screen, area)
 
-        btns = self._layout_buttons(ctx)
-        self._draw_button(ctx, btns["again"], "Play Again")
-        self._draw_button(ctx, btns["menu"],  "Main Menu")
+    def on_mouse_move(self, pos, ctx):
+        for w in self.ui.hover(pos):
+            self.invalidate(w.rect)
 
     def on_mouse_down(self, pos, button, ctx):
-        if button != 1:
-            return
-        btns = self._layout_buttons(ctx)
-        if btns["again"].collidepoint(pos):
-            self._play_again()
-        elif btns["menu"].collidepoint(pos):
-            self._to_menu()
+        if button == 1:
+            self.ui.click(pos)
+
+    def on_mouse_up(self, pos, button, ctx):
+        for w in self.ui.release(pos):
+            self.invalidate(w.rect)
 
     def on_key_down(self, key, *args):
         ctx = args[-1] if args else None
@@ -48,24 +70,6 @@ class YouWinScene(BaseScene):
         if key == K.ESCAPE:
             self._to_menu()
 
-    def _layout_buttons(self, ctx):
-        if self._btn_cache:
-            return self._btn_cache
-        sw, sh = ctx.screen.width, ctx.screen.height
-        W, H, GAP = 220, 48, 18
-        x = (sw - W) // 2
-        y0 = sh // 2 - H // 2
-        again = Rect(x, y0, W, H)
-        menu  = Rect(x, y0 + H + GAP, W, H)
-        self._btn_cache = {"again": again, "menu": menu}
-        return self._btn_cache
-
-    def _draw_button(self, ctx, r, text):
-        ctx.screen.draw.filled_rect(r, (38, 38, 38))
-        ctx.screen.draw.rect(r, (220, 220, 220))
-        ctx.screen.draw.text(text, center=(r.centerx, r.centery),
-                             fontsize=28, color=(235, 235, 235))
-
     def _play_again(self):
         self._manager.change("play", muted=self.muted)
 
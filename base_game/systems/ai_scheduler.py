@@ -0,0 +1,84 @@
+import time
+
+from .trace import tracer
+
+FULL = 0
+DUE = 1
+SPARE = 2
+DEFERRED = 3
+
+
+class AIScheduler:
+    NEAR_RADIUS = 320
+    VIEW_MARGIN = 64
+    FAR_INTERVAL = 4
+    MAX_DT = 0.10
+    BUDGET_MS = 2.0
+
+    def __init__(
+        self, near_radius=None, far_interval=None, budget_ms=None, max_dt=None, unbudgeted=False
+    ):
+        self.near_radius = self.NEAR_RADIUS if near_radius is None else near_radius
+        self.far_interval = max(1, self.FAR_INTERVAL if far_interval is None else far_interval)
+        self.budget_ms = self.BUDGET_MS if budget_ms is None else budget_ms
+        self.unbudgeted = unbudgeted
+        self.max_dt = self.MAX_DT if max_dt is None else max_dt
+        self._pending = {}
+        self._tick = 0
+        self.stats = {"full": 0, "reduced": 0, "deferred": 0}
+
+    def reset(self):
+        self._pending = {}
+        self._tick = 0
+
+    def plan(self, enemies, dt, view, player_rect):
+        self._tick += 1
+        tick = self._tick
+        pending = self._pending
+
+        view = view.inflate(self.VIEW_MARGIN * 2, self.VIEW_MARGIN * 2)
+        px, py = player_rect.center
+        r2 = self.near_radius * self.near_radius
+
+        plan = []
+        for i, e in enumerate(enemies):
+            acc = pending.get(e, 0.0) + dt
+            ex, ey = e.rect.center
+            if view.colliderect(e.rect) or (ex - px) ** 2 + (ey - py) ** 2 <= r2:
+                tier = FULL
+            elif acc >= self.max_dt:
+                tier = DUE
+            elif (i + tick) % self.far_interval == 0:
+                tier = SPARE
+            else:
+                tier = DEFERRED
+            plan.append((e, acc, tier))
+        return plan
+
+    def run(self, plan):
+        self._pending = carry = {}
+        deadline = None
+        if not self.unbudgeted:
+            deadline = time.perf_counter() + self.budget_ms / 1000.0
+
+        full = reduced = deferred = 0
+        for e, acc, tier in plan:
+            if tier == SPARE and deadline is not None and time.perf_counter() >= deadline:
+                tier = DEFERRED
+            if tier == DEFERRED:
+                carry[e] = acc
+                deferred += 1
+                continue
+            if tier == FULL:
+                full += 1
+            else:
+                reduced += 1
+            yield e, acc
+
+        self.stats["full"] = full
+        self.stats["reduced"] = reduced
+        self.stats["deferred"] = deferred
+        tracer.counter("ai", full=full, reduced=reduced, deferred=deferred)
+
+    def schedule(self, enemies, dt, view, player_rect):
+        return self.run(self.plan(enemies, dt, view, player_rect))
@@ -0,0 +1,141 @@
+import json
+import os
+import threading
+
+import pygame
+
+from .trace import tracer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MANIFEST_PATH = os.path.join(ROOT, "data", "assets.json")
+ATLAS_PATH = os.path.join(ROOT, "data", "atlas.json")
+
+
+class AssetStore:
+    def __init__(self, root=ROOT, manifest_path=MANIFEST_PATH, atlas_path=ATLAS_PATH):
+        self.root = root
+        self.manifest_path = manifest_path
+        self.atlas_path = atlas_path
+        self._manifest = None
+        self._atlas = None
+        self._sheets = {}
+        self._images = {}
+        self._lock = threading.RLock()
+        self._thread = None
+        self.loaded = 0
+        self.total = 0
+
+    @property
+    def manifest(self):
+        if self._manifest is None:
+            with self._lock:
+                if self._manifest is None:
+                    self._manifest = self._read_manifest()
+        return self._manifest
+
+    def _read_manifest(self):
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            from ..tools.build_manifest import scan
+
+            print(f"[ASSETS] {self.manifest_path} missing, scanning images/")
+            return scan(os.path.join(self.root, "images"))
+
+    @property
+    def atlas(self):
+        if self._atlas is None:
+            with self._lock:
+                if self._atlas is None:
+                    try:
+                        with open(self.atlas_path, encoding="utf-8") as f:
+                            self._atlas = json.load(f)
+                    except FileNotFoundError:
+                        self._atlas = {"sheets": [], "sprites": {}}
+        return self._atlas
+
+    def names(self):
+        return list(self.manifest["images"])
+
+    def size(self, name):
+        return tuple(self.manifest["images"][name]["size"])
+
+    def frame_count(self, prefix):
+        return self.manifest["clips"].get(prefix, 0)
+
+    def frame_names(self, prefix):
+        return [f"{prefix}_{i}" for i in range(self.frame_count(prefix))]
+
+    def _decode(self, path):
+        surf = pygame.image.load(path)
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert_alpha()
+        return surf
+
+    def sheet(self, ix):
+        surf = self._sheets.get(ix)
+        if surf is None:
+            with self._lock:
+                surf = self._sheets.get(ix)
+                if surf is None:
+                    path = os.path.join(os.path.dirname(self.atlas_path), self.atlas["sheets"][ix])
+                    surf = self._sheets[ix] = self._decode(path)
+        return surf
+
+    def _load(self, name):
+        entry = self.manifest["images"].get(name)
+        if entry is None:
+            raise KeyError(f"No image named {name!r} in the asset manifest")
+        packed = self.atlas["sprites"].get(name)
+        if packed is not None:
+            ix, x, y, w, h = packed
+            return self.sheet(ix).subsurface((x, y, w, h))
+        return self._decode(os.path.join(self.root, "images", entry["file"]))
+
+    def image(self, name):
+        surf = self._images.get(name)
+        if surf is None:
+            with self._lock, tracer.span("assets.load"):
+                surf = self._images.get(name)
+                if surf is None:
+                    surf = self._images[name] = self._load(name)
+        return surf
+
+    @property
+    def ready(self):
+        return self.total > 0 and self.loaded >= self.total
+
+    @property
+    def progress(self):
+        return self.loaded / self.total if self.total else 0.0
+
+    def preload(self, on_progress=None):
+        if self._thread is not None:
+            return self._thread
+        names = self.names()
+        self.total = len(names)
+        self._thread = threading.Thread(
+            target=self._preload, args=(names, on_progress), name="asset-preload", daemon=True
+        )
+        self._thread.start()
+        return self._thread
+
+    def _preload(self, names, on_progress):
+        for name in names:
+            with self._lock:
+                if name not in self._images:
+                    try:
+                        self._images[name] = self._load(name)
+                    except Exception as e:
+                        print(f"[ASSETS] failed to load '{name}': {e}")
+            self.loaded += 1
+            if on_progress:
+                on_progress(self.loaded, self.total)
+
+    def wait(self):
+        if self._thread is not None:
+            self._thread.join()
+
+
+assets = AssetStore()
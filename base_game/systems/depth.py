@@ -0,0 +1,40 @@
+def settle(items, key):
+    for i in range(1, len(items)):
+        obj = items[i]
+        k = key(obj)
+        j = i - 1
+        while j >= 0 and key(items[j]) > k:
+            items[j + 1] = items[j]
+            j -= 1
+        items[j + 1] = obj
+
+
+def _bottom(obj):
+    return obj.rect.bottom
+
+
+class DepthList:
+    def __init__(self):
+        self.items = []
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def add(self, obj):
+        self.items.append(obj)
+
+    def clear(self):
+        self.items.clear()
+
+    def update(self):
+        items = self.items
+        n = 0
+        for obj in items:
+            if getattr(obj, "alive", True):
+                items[n] = obj
+                n += 1
+        del items[n:]
+        settle(items, _bottom)
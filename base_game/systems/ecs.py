@@ -0,0 +1,217 @@
+import math
+from array import array
+
+from pygame import Rect
+
+from ..level import tiles
+from .events import HIT_PLAYER
+
+KIND_SKELETON = 0
+KIND_ARMADILLO = 1
+
+STATE_CHASE = 0
+STATE_REST = 1
+STATE_ROLL = 2
+
+TEAM_ENEMY = 1
+TEAM_PLAYER = 2
+
+_FIELDS = (
+    ("x", "d"),
+    ("y", "d"),
+    ("w", "H"),
+    ("h", "H"),
+    ("vx", "d"),
+    ("vy", "d"),
+    ("speed", "d"),
+    ("hp", "h"),
+    ("max_hp", "h"),
+    ("cooldown", "d"),
+    ("timer", "d"),
+    ("state", "B"),
+    ("kind", "B"),
+    ("team", "B"),
+)
+
+
+class EnemyStore:
+    def __init__(self):
+        for name, code in _FIELDS:
+            setattr(self, name, array(code))
+        self.count = 0
+
+    def spawn(self, kind, x, y, w, h, hp, speed, state=STATE_CHASE, timer=0.0, team=TEAM_ENEMY):
+        self.x.append(x)
+        self.y.append(y)
+        self.w.append(w)
+        self.h.append(h)
+        self.vx.append(0.0)
+        self.vy.append(0.0)
+        self.speed.append(speed)
+        self.hp.append(hp)
+        self.max_hp.append(hp)
+        self.cooldown.append(0.0)
+        self.timer.append(timer)
+        self.state.append(state)
+        self.kind.append(kind)
+        self.team.append(team)
+        self.count += 1
+        return self.count - 1
+
+    def clear(self):
+        for name, _code in _FIELDS:
+            del getattr(self, name)[:]
+        self.count = 0
+
+    def rect(self, i):
+        return Rect(int(self.x[i]), int(self.y[i]), self.w[i], self.h[i])
+
+    def hit_test(self, rect):
+        x, y, w, h, hp = self.x, self.y, self.w, self.h, self.hp
+        left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+        for i in range(self.count):
+            if hp[i] <= 0:
+                continue
+            if x[i] < right and x[i] + w[i] > left and y[i] < bottom and y[i] + h[i] > top:
+                return i
+        return -1
+
+    def take_damage(self, i, dmg=1):
+        self.hp[i] = max(0, self.hp[i] - int(dmg))
+
+    def compact(self):
+        hp = self.hp
+        keep = [i for i in range(self.count) if hp[i] > 0]
+        if len(keep) == self.count:
+            return False
+        for name, code in _FIELDS:
+            col = getattr(self, name)
+            setattr(self, name, array(code, [col[i] for i in keep]))
+        self.count = len(keep)
+        return True
+
+
+def decay_cooldowns(store, dt):
+    cd, timer = store.cooldown, store.timer
+    for i in range(store.count):
+        c = cd[i]
+        if c > 0.0:
+            cd[i] = c - dt if c > dt else 0.0
+        timer[i] -= dt
+
+
+def steer(store, player_rect, rng, roll_speed, rest_time, roll_time):
+    px, py = player_rect.centerx, player_rect.centery
+    x, y, w, h = store.x, store.y, store.w, store.h
+    vx, vy, speed = store.vx, store.vy, store.speed
+    state, kind, timer = store.state, store.kind, store.timer
+    for i in range(store.count):
+        dx = px - (x[i] + w[i] * 0.5)
+        dy = py - (y[i] + h[i] * 0.5)
+        if kind[i] == KIND_SKELETON:
+            d = math.hypot(dx, dy)
+            if d > 1e-6:
+                vx[i] = dx / d * speed[i]
+                vy[i] = dy / d * speed[i]
+            else:
+                vx[i] = vy[i] = 0.0
+        elif timer[i] <= 0.0:
+            if state[i] == STATE_ROLL:
+                state[i] = STATE_REST
+                timer[i] = rest_time
+                vx[i] = vy[i] = 0.0
+            else:
+                state[i] = STATE_ROLL
+                timer[i] = roll_time
+                ang = math.atan2(dy, dx) + rng.uniform(-0.35, 0.35)
+                vx[i] = math.cos(ang) * roll_speed
+                vy[i] = math.sin(ang) * roll_speed
+
+
+def _blocked(grid, wall_id, blockers, x, y, w, h):
+    ts = tiles.TILE
+    x0, y0 = int(x), int(y)
+    x1, y1 = x0 + w - 1, y0 + h - 1
+    rows = len(grid)
+    for px, py in ((x0, y0), (x1, y0), (x0, y1), (x1, y1)):
+        gy = py // ts
+        if 0 <= gy < rows:
+            row = grid[gy]
+            gx = px // ts
+            if 0 <= gx < len(row) and row[gx] == wall_id:
+                return True
+    for bx, by, bw, bh in blockers:
+        if x0 < bx + bw and x1 >= bx and y0 < by + bh and y1 >= by:
+            return True
+    return False
+
+
+def integrate(store, dt, room, blockers=()):
+    grid = room.grid
+    wall_id = int(tiles.Tile.WALL)
+    blockers = [tuple(b) for b in blockers if b]
+    x, y, w, h, vx, vy, state = store.x, store.y, store.w, store.h, store.vx, store.vy, store.state
+    for i in range(store.count):
+        nx = x[i] + vx[i] * dt
+        if _blocked(grid, wall_id, blockers, nx, y[i], w[i], h[i]):
+            if state[i] == STATE_ROLL:
+                vx[i] = -vx[i]
+        else:
+            x[i] = nx
+        ny = y[i] + vy[i] * dt
+        if _blocked(grid, wall_id, blockers, x[i], ny, w[i], h[i]):
+            if state[i] == STATE_ROLL:
+                vy[i] = -vy[i]
+        else:
+            y[i] = ny
+
+
+def contact_damage(store, player_rect, events, damage, cooldowns):
+    left, top = player_rect.left, player_rect.top
+    right, bottom = player_rect.right, player_rect.bottom
+    x, y, w, h = store.x, store.y, store.w, store.h
+    cd, kind, state = store.cooldown, store.kind, store.state
+    for i in range(store.count):
+        if cd[i] > 0.0 or (kind[i] == KIND_ARMADILLO and state[i] != STATE_ROLL):
+            continue
+        if x[i] < right and x[i] + w[i] > left and y[i] < bottom and y[i] + h[i] > top:
+            cd[i] = cooldowns[kind[i]]
+            events.push(HIT_PLAYER, damage)
+
+
+def separate(store, radius, strength=0.6):
+    cell = max(1, int(radius))
+    buckets = {}
+    x, y, w, h, state = store.x, store.y, store.w, store.h, store.state
+    vx, vy, speed = store.vx, store.vy, store.speed
+    for i in range(store.count):
+        key = (int(x[i] + w[i] * 0.5) // cell, int(y[i] + h[i] * 0.5) // cell)
+        bucket = buckets.get(key)
+        if bucket is None:
+            buckets[key] = [i]
+        else:
+            bucket.append(i)
+
+    r2 = radius * radius
+    for (cx, cy), bucket in buckets.items():
+        neighbours = []
+        for ox in (-1, 0, 1):
+            for oy in (-1, 0, 1):
+                nb = buckets.get((cx + ox, cy + oy))
+                if nb:
+                    neighbours.extend(nb)
+        for i in bucket:
+            if state[i] == STATE_ROLL:
+                continue
+            ax = x[i] + w[i] * 0.5
+            ay = y[i] + h[i] * 0.5
+            for j in neighbours:
+                if j == i:
+                    continue
+                dx = ax - (x[j] + w[j] * 0.5)
+                dy = ay - (y[j] + h[j] * 0.5)
+                d2 = dx * dx + dy * dy
+                if 0.0 < d2 < r2:
+                    push = strength * speed[i] / math.sqrt(d2)
+                    vx[i] += dx * push
+                    vy[i] += dy * push
@@ -0,0 +1,27 @@
+HIT_PLAYER = 1
+SPAWN_PROJECTILE = 2
+
+
+class EventBuffer:
+    def __init__(self, capacity=64):
+        self.codes = [0] * capacity
+        self.values = [0] * capacity
+        self.refs = [None] * capacity
+        self.count = 0
+
+    def push(self, code, value=0, ref=None):
+        n = self.count
+        if n == len(self.codes):
+            self.codes.extend([0] * n)
+            self.values.extend([0] * n)
+            self.refs.extend([None] * n)
+        self.codes[n] = code
+        self.values[n] = value
+        self.refs[n] = ref
+        self.count = n + 1
+
+    def clear(self):
+        refs = self.refs
+        for i in range(self.count):
+            refs[i] = None
+        self.count = 0
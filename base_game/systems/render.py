@@ -0,0 +1,185 @@
+from types import SimpleNamespace
+
+import pygame
+from pygame import Rect
+
+from .trace import tracer
+
+LAYER_FLOOR = 0
+LAYER_ACTORS = 1
+LAYER_LIGHT = 2
+LAYER_FOG = 3
+
+_SOLIDS_MAX = 512
+
+
+class _Draw:
+    def __init__(self, target):
+        self._target = target
+
+    def filled_rect(self, rect, color):
+        rect = Rect(rect)
+        self._target.blit(self._target.queue.solid(rect.size, color), rect.topleft)
+
+    def rect(self, rect, color):
+        rect = Rect(rect)
+        self._target.blit(self._target.queue.solid(rect.size, color, outline=True), rect.topleft)
+
+
+class LayerTarget:
+    def __init__(self, queue, layer):
+        self.queue = queue
+        self.layer = layer
+        self.draw = _Draw(self)
+
+    @property
+    def width(self):
+        return self.queue.width
+
+    @property
+    def height(self):
+        return self.queue.height
+
+    def blit(self, surf, dest, area=None, special_flags=0):
+        self.queue.blit(self.layer, surf, dest, area, special_flags)
+
+
+class DepthRun(LayerTarget):
+    def __init__(self, queue, layer):
+        super().__init__(queue, layer)
+        self.depth = 0
+        self.entries = []
+
+    def blit(self, surf, dest, area=None, special_flags=0):
+        item = self.queue.item(surf, dest, area, special_flags)
+        if item is not None:
+            self.entries.append((self.depth, item))
+
+
+def merge(a, b):
+    a, b = iter(a), iter(b)
+    x, y = next(a, None), next(b, None)
+    while x is not None and y is not None:
+        if y[0] < x[0]:
+            yield y
+            y = next(b, None)
+        else:
+            yield x
+            x = next(a, None)
+    if x is not None:
+        yield x
+        yield from a
+    if y is not None:
+        yield y
+        yield from b
+
+
+def frozen_frame(surface, dim=0, blur=1):
+    frame = surface.copy()
+    if blur > 1:
+        w, h = frame.get_size()
+        small = pygame.transform.smoothscale(frame, (max(1, w // blur), max(1, h // blur)))
+        frame = pygame.transform.smoothscale(small, (w, h))
+    if dim:
+        shade = pygame.Surface(frame.get_size(), pygame.SRCALPHA)
+        shade.fill((0, 0, 0, dim))
+        frame.blit(shade, (0, 0))
+    return frame
+
+
+class RenderQueue:
+    def __init__(self):
+        self.width = 0
+        self.height = 0
+        self._layers = {}
+        self._runs = {}
+        self._targets = {}
+        self._contexts = {}
+        self._solids = {}
+        self.submitted = 0
+        self.culled = 0
+
+    def begin(self, width, height):
+        self.width = width
+        self.height = height
+        for items in self._layers.values():
+            items.clear()
+        for runs in self._runs.values():
+            for run in runs:
+                run.entries.clear()
+                run.depth = 0
+        self.submitted = 0
+        self.culled = 0
+
+    def target(self, layer, run=None):
+        k = (layer, run)
+        t = self._targets.get(k)
+        if t is None:
+            if run is None:
+                t = LayerTarget(self, layer)
+            else:
+                t = DepthRun(self, layer)
+                self._runs.setdefault(layer, []).append(t)
+            self._targets[k] = t
+        return t
+
+    def context(self, layer, run=None):
+        k = (layer, run)
+        c = self._contexts.get(k)
+        if c is None:
+            c = self._contexts[k] = SimpleNamespace(screen=self.target(layer, run))
+        return c
+
+    def item(self, surf, dest, area=None, special_flags=0):
+        x, y = dest[0], dest[1]
+        if area is None:
+            w, h = surf.get_size()
+        else:
+            w, h = area[2], area[3]
+        if x >= self.width or y >= self.height or x + w <= 0 or y + h <= 0:
+            self.culled += 1
+            return None
+        if special_flags:
+            return (surf, (x, y), area, special_flags)
+        return (surf, (x, y)) if area is None else (surf, (x, y), area)
+
+    def blit(self, layer, surf, dest, area=None, special_flags=0):
+        item = self.item(surf, dest, area, special_flags)
+        if item is None:
+            return
+        items = self._layers.get(layer)
+        if items is None:
+            items = self._layers[layer] = []
+        items.append(item)
+
+    def solid(self, size, color, outline=False):
+        k = (size, tuple(color), outline)
+        surf = self._solids.get(k)
+        if surf is None:
+            if len(self._solids) >= _SOLIDS_MAX:
+                self._solids.clear()
+            if outline:
+                surf = pygame.Surface(size, pygame.SRCALPHA)
+                pygame.draw.rect(surf, color, surf.get_rect(), 1)
+            else:
+                surf = pygame.Surface(size)
+                surf.fill(color)
+            self._solids[k] = surf
+        return surf
+
+    def flush(self, surface):
+        with tracer.span("RenderQueue.flush"):
+            for layer in sorted(self._layers.keys() | self._runs.keys()):
+                items = self._layers.get(layer)
+                if items:
+                    surface.blits(items, doreturn=False)
+                    self.submitted += len(items)
+                runs = self._runs.get(layer)
+                if not runs:
+                    continue
+                merged = runs[0].entries
+                for run in runs[1:]:
+                    merged = merge(merged, run.entries)
+                surface.blits((item for _depth, item in merged), doreturn=False)
+                self.submitted += sum(len(run.entries) for run in runs)
+        tracer.counter("render", blits=self.submitted, culled=self.culled)
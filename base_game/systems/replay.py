@@ -0,0 +1,129 @@
+import atexit
+import hashlib
+import os
+import struct
+import zlib
+
+MAGIC = b"KRPL"
+VERSION = 2
+INPUT_KEYS = ("W", "A", "S", "D", "UP", "DOWN", "LEFT", "RIGHT")
+
+_HEADER = struct.Struct("<4sHQI32s")
+
+
+def key_mask(keyboard, keys):
+    mask = 0
+    for bit, name in enumerate(INPUT_KEYS):
+        if keyboard[keys[name]]:
+            mask |= 1 << bit
+    return mask
+
+
+class MaskKeyboard:
+    def __init__(self, keys, mask=0):
+        self._bits = {keys[name]: 1 << bit for bit, name in enumerate(INPUT_KEYS)}
+        self.mask = mask
+
+    def __getitem__(self, k):
+        return bool(self.mask & self._bits.get(k, 0))
+
+
+def state_digest(play):
+    h = hashlib.sha256()
+    ent = play.player_ent
+    h.update(repr((tuple(ent.rect), ent.hp, play.room_state, play.current_room_id)).encode())
+    for e in play.active_enemies:
+        h.update(repr((type(e).__name__, tuple(e.rect), e.hp, e._vx, e._vy)).encode())
+    for p in play.projectiles:
+        h.update(repr((tuple(p.rect), p.team, p.ttl)).encode())
+    return h.digest()
+
+
+class Replay:
+    def __init__(self, seed, dts, masks, digest=b""):
+        self.seed = seed
+        self.dts = dts
+        self.masks = masks
+        self.digest = digest
+
+    def __len__(self):
+        return len(self.dts)
+
+    def save(self, path):
+        n = len(self.dts)
+        body = struct.pack(f"<{n}d", *self.dts) + bytes(self.masks)
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, self.seed, n, self.digest.ljust(32, b"\0")))
+            f.write(zlib.compress(body, 9))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, seed, n, digest = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"'{path}' is not a v{VERSION} replay")
+        body = zlib.decompress(data[_HEADER.size:])
+        dts = list(struct.unpack_from(f"<{n}d", body))
+        masks = list(body[8 * n: 9 * n])
+        return cls(seed, dts, masks, digest.rstrip(b"\0"))
+
+
+class SessionRecorder:
+    def __init__(self, path):
+        self.path = path
+        self._session = None
+        self._count = 0
+        self._recording = False
+        atexit.register(self.flush)
+
+    def before_update(self, manager, dt, ctx):
+        play = manager._scenes.get("play")
+        self._recording = manager.current is play and play is not None
+        if not self._recording:
+            if play not in manager.stack:
+                self.flush()
+            return
+        if self._session is None or self._session.seed != play.seed:
+            self.flush()
+            self._session = Replay(play.seed, [], [])
+            play.ai.unbudgeted = True
+        self._session.dts.append(float(dt))
+        self._session.masks.append(key_mask(ctx.keyboard, ctx.keys))
+
+    def after_update(self, manager):
+        if self._recording:
+            self._session.digest = state_digest(manager._scenes["play"])
+
+    def flush(self):
+        if self._session is None or not len(self._session):
+            self._session = None
+            return
+        root, ext = os.path.splitext(self.path)
+        path = self.path if self._count == 0 else f"{root}-{self._count}{ext}"
+        self._session.save(path)
+        print(f"[REPLAY] saved {len(self._session)} ticks (seed {self._session.seed}) -> {path}")
+        self._count += 1
+        self._session = None
+
+
+def play_back(replay, manager, ctx, draw=None):
+    keyboard = MaskKeyboard(ctx.keys)
+    ctx.keyboard = keyboard
+    manager.change("play", muted=True, seed=replay.seed)
+    play = manager.current
+    play.ai.unbudgeted = True
+
+    ticks = 0
+    for dt, mask in zip(replay.dts, replay.masks):
+        if manager.current is not play:
+            break
+        keyboard.mask = mask
+        manager.update(dt, ctx)
+        ticks += 1
+        if draw:
+            draw()
+    return ticks, state_digest(play)
@@ -0,0 +1,17 @@
+import random
+
+STREAMS = ("worldgen", "spawn", "ai", "fx")
+
+
+class RngStreams:
+    def __init__(self, seed=None):
+        self.seed = random.getrandbits(32) if seed is None else int(seed)
+        self._streams = {}
+        for name in STREAMS:
+            setattr(self, name, self.stream(name))
+
+    def stream(self, name):
+        rng = self._streams.get(name)
+        if rng is None:
+            rng = self._streams[name] = random.Random(f"{self.seed}:{name}")
+        return rng
@@ -0,0 +1,51 @@
+import math
+
+import pygame
+
+from .assets import assets
+
+DIRECTIONS = 32
+
+PLAYER_BOLT = "fx/player_bolt"
+SEED = "plant/projectiles/seed_projectile_right"
+
+_TABLES = {}
+
+
+def _player_bolt():
+    surf = pygame.Surface((12, 6), pygame.SRCALPHA)
+    pygame.draw.ellipse(surf, (220, 220, 60), surf.get_rect())
+    pygame.draw.ellipse(surf, (255, 255, 200), (4, 2, 7, 2))
+    return surf
+
+
+_BUILDERS = {PLAYER_BOLT: _player_bolt}
+
+
+class RotatedSprite:
+    __slots__ = ("frames", "step")
+
+    def __init__(self, base, directions=DIRECTIONS):
+        self.step = math.tau / directions
+        self.frames = tuple(
+            pygame.transform.rotate(base, -math.degrees(i * self.step)) for i in range(directions)
+        )
+
+    def index(self, vx, vy):
+        return round(math.atan2(vy, vx) / self.step) % len(self.frames)
+
+    def for_velocity(self, vx, vy):
+        return self.frames[self.index(vx, vy)]
+
+
+def table(name, directions=DIRECTIONS):
+    t = _TABLES.get((name, directions))
+    if t is None:
+        build = _BUILDERS.get(name)
+        base = build() if build else assets.image(name)
+        t = _TABLES[(name, directions)] = RotatedSprite(base, directions)
+    return t
+
+
+def resolve(name, vx, vy):
+    return table(name).for_velocity(vx, vy)
@@ -0,0 +1,100 @@
+import math
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+BATCH_MIN = 6
+SEP_CELL = 30
+
+
+def _sep_params(dist, attack_range):
+    if dist <= attack_range + 6:
+        return 30, 0.7
+    return 28, 0.6
+
+
+def neighbour_cells(centres):
+    cell = SEP_CELL
+    cells = {}
+    for c in centres:
+        key = (c[0] // cell, c[1] // cell)
+        bucket = cells.get(key)
+        if bucket is None:
+            cells[key] = [c]
+        else:
+            bucket.append(c)
+    return cells
+
+
+def _neighbours(cells, cx, cy):
+    gx, gy = cx // SEP_CELL, cy // SEP_CELL
+    for ox in (-1, 0, 1):
+        for oy in (-1, 0, 1):
+            nb = cells.get((gx + ox, gy + oy))
+            if nb:
+                yield from nb
+
+
+def skeleton_steer(rect, player_rect, cells, attack_range):
+    dx = player_rect.centerx - rect.centerx
+    dy = player_rect.centery - rect.centery
+    dist = math.sqrt(dx * dx + dy * dy)
+    if dist > 1e-6:
+        nx, ny = dx / dist, dy / dist
+    else:
+        nx, ny = 0.0, 0.0
+
+    radius, push = _sep_params(dist, attack_range)
+    r2 = radius * radius
+    sx = sy = 0.0
+    cx, cy = rect.centerx, rect.centery
+    for ox, oy in _neighbours(cells, cx, cy):
+        dx2 = cx - ox
+        dy2 = cy - oy
+        d2 = dx2 * dx2 + dy2 * dy2
+        if 0 < d2 < r2:
+            inv = 1.0 / (math.sqrt(d2) + 1e-6)
+            sx += dx2 * inv
+            sy += dy2 * inv
+    return nx, ny, dist, sx * push, sy * push
+
+
+def batch_skeleton_steer(skeletons, cells, player_rect, attack_range):
+    if np is None or len(skeletons) < BATCH_MIN:
+        for s in skeletons:
+            s._steer = None
+        return False
+
+    owner = []
+    nbr = []
+    for i, s in enumerate(skeletons):
+        cx, cy = s.rect.center
+        for c in _neighbours(cells, cx, cy):
+            nbr.append(c)
+            owner.append(i)
+
+    count = len(skeletons)
+    pos = np.array([s.rect.center for s in skeletons], dtype=np.float64)
+    owner = np.array(owner, dtype=np.intp)
+    nbr = np.array(nbr, dtype=np.float64).reshape(-1, 2)
+
+    to_player = np.array(player_rect.center, dtype=np.float64) - pos
+    dist = np.sqrt(to_player[:, 0] ** 2 + to_player[:, 1] ** 2)
+    safe = np.where(dist > 1e-6, dist, 1.0)
+    n = np.where((dist > 1e-6)[:, None], to_player / safe[:, None], 0.0)
+
+    close = dist <= attack_range + 6
+    r2 = np.where(close, 30.0 * 30.0, 28.0 * 28.0)
+    push = np.where(close, 0.7, 0.6)
+
+    d = pos[owner] - nbr
+    d2 = d[:, 0] ** 2 + d[:, 1] ** 2
+    inv = np.where((d2 > 0) & (d2 < r2[owner]), 1.0 / (np.sqrt(d2) + 1e-6), 0.0)
+    sx = np.bincount(owner, weights=d[:, 0] * inv, minlength=count) * push
+    sy = np.bincount(owner, weights=d[:, 1] * inv, minlength=count) * push
+
+    for s, (nx, ny), dd, x, y in zip(skeletons, n.tolist(), dist.tolist(), sx, sy):
+        s._steer = (nx, ny, dd, float(x), float(y))
+    return True
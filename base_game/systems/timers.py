@@ -0,0 +1,37 @@
+from array import array
+
+
+class TimerService:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.now = 0.0
+        self._deadlines = array("d")
+        self._free = []
+
+    def advance(self, dt):
+        self.now += dt
+
+    def new(self, duration=0.0):
+        if self._free:
+            handle = self._free.pop()
+            self._deadlines[handle] = self.now + duration
+            return handle
+        self._deadlines.append(self.now + duration)
+        return len(self._deadlines) - 1
+
+    def free(self, handle):
+        self._free.append(handle)
+
+    def start(self, handle, duration):
+        self._deadlines[handle] = self.now + duration
+
+    def cancel(self, handle):
+        self._deadlines[handle] = self.now
+
+    def ready(self, handle):
+        return self.now >= self._deadlines[handle]
+
+
+timers = TimerService()
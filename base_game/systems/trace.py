@@ -0,0 +1,118 @@
+import json
+import os
+import time
+
+from .. import config
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "t0")
+
+    def __init__(self, tracer, name):
+        self.tracer = tracer
+        self.name = name
+        self.t0 = 0.0
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer._complete(self.name, self.t0, time.perf_counter())
+        return False
+
+
+class FrameTracer:
+    PID = 1
+    TID = 1
+
+    def __init__(self):
+        self.active = False
+        self.path = None
+        self._events = []
+        self._t_origin = 0.0
+        self._t_stop = None
+
+    def start(self, seconds=None, path=None):
+        if self.active:
+            return
+        seconds = config.TRACE_SECONDS if seconds is None else seconds
+        if path is None:
+            stamp = time.strftime("%Y%m%d-%H%M%S")
+            path = os.path.join(config.TRACE_DIR, f"frames-{stamp}.json")
+        self.path = path
+        self._events = []
+        self._t_origin = time.perf_counter()
+        self._t_stop = self._t_origin + seconds if seconds and seconds > 0 else None
+        self.active = True
+        print(f"[TRACE] capturing {seconds:.1f}s -> {self.path}")
+
+    def span(self, name):
+        if not self.active:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def counter(self, name, **values):
+        if not self.active:
+            return
+        ts = (time.perf_counter() - self._t_origin) * 1e6
+        self._events.append(("C", name, ts, 0.0, values))
+
+    def instant(self, name, **args):
+        if not self.active:
+            return
+        ts = (time.perf_counter() - self._t_origin) * 1e6
+        self._events.append(("i", name, ts, 0.0, args))
+
+    def tick(self):
+        if self.active and self._t_stop is not None and time.perf_counter() >= self._t_stop:
+            self.stop()
+
+    def stop(self):
+        if not self.active:
+            return None
+        self.active = False
+        events = [
+            {"ph": "M", "name": "process_name", "pid": self.PID, "args": {"name": config.TITLE}},
+            {"ph": "M", "name": "thread_name", "pid": self.PID, "tid": self.TID,
+             "args": {"name": "main"}},
+        ]
+        for ph, name, ts, dur, args in self._events:
+            ev = {"ph": ph, "name": name, "ts": round(ts, 3), "pid": self.PID, "tid": self.TID}
+            if ph == "X":
+                ev["dur"] = round(dur, 3)
+            elif ph == "i":
+                ev["s"] = "t"
+            if args:
+                ev["args"] = args
+            events.append(ev)
+        self._events = []
+
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        print(f"[TRACE] wrote {len(events)} events -> {self.path}")
+        return self.path
+
+    def _complete(self, name, t0, t1):
+        if not self.active:
+            return
+        self._events.append(("X", name, (t0 - self._t_origin) * 1e6, (t1 - t0) * 1e6, None))
+
+
+tracer = FrameTracer()
@@ -0,0 +1,87 @@
+import argparse
+import json
+import os
+import sys
+
+from .build_manifest import IMAGES_DIR, MANIFEST_PATH, scan
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ATLAS_DIR = os.path.join(ROOT, "data")
+SHEET_SIZE = 1024
+PADDING = 1
+
+
+def pack(sizes, sheet_size=SHEET_SIZE, padding=PADDING):
+    order = sorted(sizes, key=lambda n: (-sizes[n][1], -sizes[n][0], n))
+    placed = {}
+    heights = []
+    sheet = x = y = shelf_h = 0
+    for name in order:
+        w, h = sizes[name]
+        if w + padding > sheet_size or h + padding > sheet_size:
+            continue
+        if x + w + padding > sheet_size:
+            x, y = 0, y + shelf_h
+            shelf_h = 0
+        if y + h + padding > sheet_size:
+            heights.append(y)
+            sheet += 1
+            x = y = shelf_h = 0
+        placed[name] = (sheet, x, y, w, h)
+        x += w + padding
+        shelf_h = max(shelf_h, h + padding)
+    if placed:
+        heights.append(y + shelf_h)
+    return placed, heights
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pack base_game/images into atlas sheets.")
+    parser.add_argument("--output", default=ATLAS_DIR)
+    parser.add_argument("--size", type=int, default=SHEET_SIZE)
+    args = parser.parse_args(argv)
+
+    import pygame
+
+    try:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            images = json.load(f)["images"]
+    except FileNotFoundError:
+        images = scan()["images"]
+
+    placed, heights = pack({n: tuple(e["size"]) for n, e in images.items()}, args.size)
+
+    sheets = [
+        pygame.Surface((args.size, max(1, h)), pygame.SRCALPHA, 32) for h in heights
+    ]
+    for s in sheets:
+        s.fill((0, 0, 0, 0))
+    for name, (ix, x, y, _w, _h) in placed.items():
+        img = pygame.image.load(os.path.join(IMAGES_DIR, images[name]["file"]))
+        sheets[ix].blit(img, (x, y))
+
+    os.makedirs(args.output, exist_ok=True)
+    files = []
+    for ix, s in enumerate(sheets):
+        fn = f"atlas_{ix}.png"
+        pygame.image.save(s, os.path.join(args.output, fn))
+        files.append(fn)
+
+    index = {
+        "version": 1,
+        "sheets": files,
+        "sprites": {n: list(placed[n]) for n in sorted(placed)},
+    }
+    with open(os.path.join(args.output, "atlas.json"), "w", encoding="utf-8") as f:
+        json.dump(index, f, separators=(",", ":"), sort_keys=True)
+        f.write("\n")
+
+    skipped = sorted(set(images) - set(placed))
+    print(f"{len(placed)} sprites in {len(files)} sheet(s) -> {args.output}")
+    for name in skipped:
+        print(f"  not packed (larger than {args.size}px): {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+import argparse
+import json
+import os
+import re
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMAGES_DIR = os.path.join(ROOT, "images")
+MANIFEST_PATH = os.path.join(ROOT, "data", "assets.json")
+EXTENSIONS = (".png", ".gif", ".jpg", ".jpeg", ".bmp")
+
+_FRAME = re.compile(r"^(.*)_(\d+)$")
+
+
+def scan(images_dir=IMAGES_DIR):
+    import pygame
+
+    images = {}
+    for dirpath, dirnames, filenames in os.walk(images_dir):
+        dirnames.sort()
+        for fn in sorted(filenames):
+            stem, ext = os.path.splitext(fn)
+            if ext.lower() not in EXTENSIONS:
+                continue
+            path = os.path.join(dirpath, fn)
+            rel = os.path.relpath(path, images_dir).replace(os.sep, "/")
+            w, h = pygame.image.load(path).get_size()
+            images[rel[: -len(ext)]] = {"file": rel, "size": [w, h]}
+
+    clips = {}
+    for name in images:
+        m = _FRAME.match(name)
+        if not m or m.group(2) != "0":
+            continue
+        prefix = m.group(1)
+        n = 0
+        while f"{prefix}_{n}" in images:
+            n += 1
+        clips[prefix] = n
+
+    return {"version": 1, "images": images, "clips": dict(sorted(clips.items()))}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Regenerate the image asset manifest.")
+    parser.add_argument("--images", default=IMAGES_DIR)
+    parser.add_argument("--output", default=MANIFEST_PATH)
+    args = parser.parse_args(argv)
+
+    manifest = scan(args.images)
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+        f.write("\n")
+
+    print(f"{len(manifest['images'])} images, {len(manifest['clips'])} clips -> {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
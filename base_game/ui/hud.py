@@ -0,0 +1,35 @@
+from types import SimpleNamespace
+
+import pygame
+from pgzero.screen import Screen
+
+from ..systems.trace import tracer
+
+
+class HudLayer:
+    def __init__(self, paint):
+        self._paint = paint
+        self._key = None
+        self.surface = None
+        self.rebuilds = 0
+
+    def invalidate(self):
+        self._key = None
+
+    def draw(self, screen, *values):
+        key = (screen.width, screen.height, values)
+        if key != self._key:
+            self._key = key
+            self._rebuild((screen.width, screen.height))
+        screen.blit(self.surface, (0, 0))
+
+    def _rebuild(self, size):
+        with tracer.span("HudLayer.rebuild"):
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            self._paint(SimpleNamespace(screen=Screen(surf)))
+            if pygame.display.get_surface() is not None:
+                surf = surf.convert_alpha()
+            surf.set_alpha(255, pygame.RLEACCEL)
+        self.surface = surf
+        self.rebuilds += 1
+        tracer.counter("hud", rebuilds=self.rebuilds)
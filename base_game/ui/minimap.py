@@ -0,0 +1,115 @@
+import pygame
+from pygame import Rect
+
+from ..level import tiles
+from ..systems.trace import tracer
+
+CHUNK = 256
+BACKGROUND = (0, 0, 0, 150)
+BORDER = (15, 15, 15)
+WALL = (40, 40, 40)
+DOOR = (200, 200, 200)
+PLAYER = (255, 255, 255)
+STATE_COLORS = {
+    "unvisited": (70, 70, 70),
+    "arming": (200, 170, 60),
+    "locked": (200, 60, 60),
+    "cleared": (70, 150, 90),
+}
+
+
+class Minimap:
+    def __init__(self, room, scale=2, size=(160, 110)):
+        self.room = room
+        self.scale = scale
+        self.size = size
+        self.origin = (0, 0)
+        self.redraws = 0
+        self.revision = 0
+        self._chunks = {}
+        self._shown = {}
+        self._view = None
+        self._focus = None
+        self._dirty = True
+
+    def reveal(self, rid, state):
+        if self._shown.get(rid) == state:
+            return
+        with tracer.span("Minimap.reveal"):
+            self._paint_room(rid, state)
+            if state != "unvisited":
+                for n in self.room.adj.get(rid, ()):
+                    if n not in self._shown:
+                        self._paint_room(n, "unvisited")
+        self._dirty = True
+        self.revision += 1
+
+    def _paint_room(self, rid, state):
+        self._shown[rid] = state
+        meta = self.room.rooms_meta[rid]
+        self._fill(meta["rect_g"], WALL)
+        self._fill(meta["rect_inner_g"], STATE_COLORS.get(state, STATE_COLORS["unvisited"]))
+        for key in meta["doors"]:
+            door = self.room.door_meta[key]
+            if all(r in self._shown for r in door["rooms"]):
+                r = door["rect_px"]
+                t = tiles.TILE
+                self._fill(Rect(r.x // t, r.y // t, max(1, r.w // t), max(1, r.h // t)), DOOR)
+
+    def _fill(self, rect_g, color):
+        s = self.scale
+        r = Rect(rect_g.x * s, rect_g.y * s, rect_g.w * s, rect_g.h * s)
+        c = CHUNK
+        for cy in range(r.top // c, (r.bottom - 1) // c + 1):
+            for cx in range(r.left // c, (r.right - 1) // c + 1):
+                chunk = self._chunks.get((cx, cy))
+                if chunk is None:
+                    chunk = self._chunks[(cx, cy)] = pygame.Surface((c, c), pygame.SRCALPHA)
+                chunk.fill(color, r.move(-cx * c, -cy * c))
+
+    def _compose(self):
+        w, h = self.size
+        if self._view is None:
+            self._view = pygame.Surface((w, h), pygame.SRCALPHA)
+        view = self._view
+        view.fill(BACKGROUND)
+        ox, oy = self.origin
+        c = CHUNK
+        for cy in range(oy // c, (oy + h - 1) // c + 1):
+            for cx in range(ox // c, (ox + w - 1) // c + 1):
+                chunk = self._chunks.get((cx, cy))
+                if chunk is not None:
+                    view.blit(chunk, (cx * c - ox, cy * c - oy))
+        pygame.draw.rect(view, BORDER, view.get_rect(), 1)
+        self._dirty = False
+        self.redraws += 1
+
+    def _set_focus(self, focus):
+        if focus is not None and focus != self._focus:
+            self._focus = focus
+            cx, cy = self.room.rooms_meta[focus]["center_g"]
+            s = self.scale
+            self.origin = (cx * s - self.size[0] // 2, cy * s - self.size[1] // 2)
+            self._dirty = True
+
+    def _marker(self, player_px):
+        s = self.scale
+        t = tiles.TILE
+        w, h = self.size
+        mx = max(1, min(w - 2, player_px[0] * s // t - self.origin[0]))
+        my = max(1, min(h - 2, player_px[1] * s // t - self.origin[1]))
+        return mx, my
+
+    def key(self, focus=None):
+        self._set_focus(focus)
+        return self.revision, self._focus
+
+    def draw(self, screen, pos, focus=None):
+        self._set_focus(focus)
+        if self._dirty:
+            self._compose()
+        screen.blit(self._view, pos)
+
+    def draw_marker(self, screen, pos, player_px):
+        mx, my = self._marker(player_px)
+        screen.draw.filled_rect(Rect(pos[0] + mx - 1, pos[1] + my - 1, 3, 3), PLAYER)
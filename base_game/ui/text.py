@@ -0,0 +1,107 @@
+from collections import OrderedDict
+
+import pygame
+from pgzero import ptext
+
+CACHE_SIZE = 256
+DIGITS = "0123456789"
+
+_ANCHORS = {
+    "topleft": (0.0, 0.0),
+    "midtop": (0.5, 0.0),
+    "topright": (1.0, 0.0),
+    "midleft": (0.0, 0.5),
+    "center": (0.5, 0.5),
+    "midright": (1.0, 0.5),
+    "bottomleft": (0.0, 1.0),
+    "midbottom": (0.5, 1.0),
+    "bottomright": (1.0, 1.0),
+}
+
+
+def anchored(size, **anchor):
+    (name, (x, y)), = anchor.items()
+    hx, vy = _ANCHORS[name]
+    return int(round(x - hx * size[0])), int(round(y - vy * size[1]))
+
+
+class TextCache:
+    def __init__(self, maxsize=CACHE_SIZE):
+        self.maxsize = maxsize
+        self._surfs = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._surfs)
+
+    def render(self, text, fontsize, color, shadow=None):
+        key = (text, fontsize, tuple(color), shadow)
+        surf = self._surfs.get(key)
+        if surf is not None:
+            self._surfs.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = ptext.getsurf(text, fontsize=fontsize, color=color, shadow=shadow, cache=False)
+        self._surfs[key] = surf
+        if len(self._surfs) > self.maxsize:
+            self._surfs.popitem(last=False)
+        return surf
+
+    def draw(self, target, text, fontsize, color, shadow=None, **anchor):
+        surf = self.render(text, fontsize, color, shadow)
+        pos = anchored(surf.get_size(), **anchor)
+        target.blit(surf, pos)
+        return pygame.Rect(pos, surf.get_size())
+
+    def clear(self):
+        self._surfs.clear()
+
+
+class GlyphAtlas:
+    def __init__(self, fontsize, color, chars=DIGITS):
+        glyphs = [ptext.getsurf(c, fontsize=fontsize, color=color, cache=False) for c in chars]
+        self.height = max(g.get_height() for g in glyphs)
+        width = sum(g.get_width() for g in glyphs)
+        self.sheet = pygame.Surface((width, self.height), pygame.SRCALPHA)
+        self.areas = {}
+        x = 0
+        for c, g in zip(chars, glyphs):
+            self.sheet.blit(g, (x, 0))
+            self.areas[c] = pygame.Rect(x, 0, g.get_width(), self.height)
+            x += g.get_width()
+
+    def width(self, text):
+        areas = self.areas
+        return sum(areas[c].w for c in text)
+
+    def draw(self, target, text, **anchor):
+        x, y = anchored((self.width(text), self.height), **anchor)
+        left = x
+        surface = getattr(target, "surface", target)
+        for c in text:
+            area = self.areas[c]
+            surface.blit(self.sheet, (x, y), area)
+            x += area.w
+        return pygame.Rect(left, y, x - left, self.height)
+
+
+_CACHE = TextCache()
+_ATLASES = {}
+
+
+def render(text, fontsize, color, shadow=None):
+    return _CACHE.render(text, fontsize, color, shadow)
+
+
+def draw(target, text, fontsize, color, shadow=None, **anchor):
+    return _CACHE.draw(target, text, fontsize, color, shadow, **anchor)
+
+
+def glyphs(fontsize, color, chars=DIGITS):
+    k = (fontsize, tuple(color), chars)
+    atlas = _ATLASES.get(k)
+    if atlas is None:
+        atlas = _ATLASES[k] = GlyphAtlas(fontsize, color, chars)
+    return atlas
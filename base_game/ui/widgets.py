@@ -0,0 +1,245 @@
+import pygame
+from pygame import Rect
+
+from . import text
+
+NORMAL = "normal"
+HOVER = "hover"
+PRESSED = "pressed"
+
+CELL = 64
+
+
+class SpatialIndex:
+    def __init__(self, cell=CELL):
+        self.cell = cell
+        self._cells = {}
+
+    def clear(self):
+        self._cells.clear()
+
+    def insert(self, item, rect):
+        c = self.cell
+        for cy in range(rect.top // c, (rect.bottom - 1) // c + 1):
+            for cx in range(rect.left // c, (rect.right - 1) // c + 1):
+                self._cells.setdefault((cx, cy), []).append(item)
+
+    def query(self, pos):
+        return self._cells.get((pos[0] // self.cell, pos[1] // self.cell), ())
+
+
+class Widget:
+    def __init__(self, on_click=None, hit_pad=0, dynamic=False):
+        self.rect = Rect(0, 0, 0, 0)
+        self.visible = True
+        self.dynamic = dynamic
+        self.state = NORMAL
+        self.on_click = on_click
+        self.hit_pad = hit_pad
+        self._surfs = {}
+
+    @property
+    def hit_rect(self):
+        return self.rect.inflate(2 * self.hit_pad, 2 * self.hit_pad)
+
+    @property
+    def size(self):
+        return self.rect.size
+
+    def place(self, rect=None, **anchor):
+        if rect is None:
+            rect = Rect(text.anchored(self.size, **anchor), self.size)
+        rect = Rect(rect)
+        if rect.size != self.rect.size:
+            self._surfs.clear()
+        self.rect = rect
+
+    def surface(self, state=None):
+        state = state or self.state
+        surf = self._surfs.get(state)
+        if surf is None:
+            surf = self._surfs[state] = self.render(state)
+        return surf
+
+    def render(self, state):
+        return None
+
+    def draw(self, target, state=None):
+        if not self.visible:
+            return
+        surf = self.surface(state)
+        if surf is not None:
+            target.blit(surf, self.rect.topleft)
+
+
+class Label(Widget):
+    def __init__(self, label, fontsize, color, shadow=None):
+        super().__init__()
+        self.label = label
+        self.fontsize = fontsize
+        self.color = color
+        self.shadow = shadow
+
+    @property
+    def size(self):
+        return text.render(self.label, self.fontsize, self.color, self.shadow).get_size()
+
+    def render(self, state):
+        return text.render(self.label, self.fontsize, self.color, self.shadow)
+
+
+class Button(Widget):
+    def __init__(
+        self,
+        label,
+        on_click=None,
+        fontsize=32,
+        color=(70, 70, 70),
+        hover=None,
+        pressed=None,
+        text_color=(255, 255, 255),
+        border=None,
+    ):
+        super().__init__(on_click)
+        self.label = label
+        self.fontsize = fontsize
+        self.colors = {
+            NORMAL: color,
+            HOVER: hover or color,
+            PRESSED: pressed or hover or color,
+        }
+        self.text_color = text_color
+        self.border = border
+
+    def render(self, state):
+        surf = pygame.Surface(self.rect.size)
+        surf.fill(self.colors[state])
+        if self.border is not None:
+            pygame.draw.rect(surf, self.border, surf.get_rect(), 1)
+        w, h = self.rect.size
+        text.draw(surf, self.label, self.fontsize, self.text_color, center=(w // 2, h // 2))
+        return surf
+
+
+class IconButton(Widget):
+    def __init__(self, image, on_click=None, hit_pad=0, dynamic=False):
+        super().__init__(on_click, hit_pad, dynamic)
+        self.image = image
+
+    @property
+    def size(self):
+        return self.image.get_size()
+
+    def set_image(self, image):
+        if image is not self.image:
+            self.image = image
+            self._surfs.clear()
+
+    def render(self, state):
+        return self.image
+
+
+class Panel(Widget):
+    def __init__(self, layout=None, color=None):
+        super().__init__()
+        self.children = []
+        self.color = color
+        self.index = SpatialIndex()
+        self.hovered = None
+        self.pressed = None
+        self._layout = layout
+        self._laid_out = None
+
+    def add(self, widget):
+        self.children.append(widget)
+        return widget
+
+    def layout(self, width, height):
+        if self._laid_out == (width, height):
+            return False
+        self._laid_out = (width, height)
+        self.place((0, 0, width, height))
+        if self._layout is not None:
+            self._layout(self, width, height)
+        self.reindex()
+        return True
+
+    def reindex(self):
+        self.index.clear()
+        for w in self.children:
+            if w.on_click is not None:
+                self.index.insert(w, w.hit_rect)
+
+    def bounds(self):
+        rects = [w.rect for w in self.children if w.visible]
+        return rects[0].unionall(rects[1:]) if rects else Rect(0, 0, 0, 0)
+
+    def hit(self, pos):
+        for w in reversed(self.index.query(pos)):
+            if w.visible and w.hit_rect.collidepoint(pos):
+                return w
+        return None
+
+    def _set(self, widget, state, changed):
+        if widget is not None and widget.state != state:
+            widget.state = state
+            changed.append(widget)
+
+    def reset(self):
+        changed = []
+        for w in self.children:
+            self._set(w, NORMAL, changed)
+        self.hovered = self.pressed = None
+        return changed
+
+    def hover(self, pos):
+        w = self.hit(pos)
+        if w is self.hovered:
+            return ()
+        changed = []
+        self._set(self.hovered, NORMAL, changed)
+        self._set(w, PRESSED if w is not None and w is self.pressed else HOVER, changed)
+        self.hovered = w
+        return changed
+
+    def click(self, pos):
+        w = self.hit(pos)
+        if w is None:
+            return None
+        if self.hovered is not w:
+            self._set(self.hovered, NORMAL, [])
+        self._set(w, PRESSED, [])
+        self.pressed = self.hovered = w
+        w.on_click()
+        return w
+
+    def release(self, pos):
+        w, self.pressed = self.pressed, None
+        if w is None:
+            return ()
+        changed = []
+        self._set(w, HOVER if w is self.hit(pos) else NORMAL, changed)
+        return changed
+
+    def render(self, state):
+        if self.color is None:
+            return None
+        surf = pygame.Surface(self.rect.size)
+        surf.fill(self.color)
+        return surf
+
+    def draw(self, target, state=None):
+        super().draw(target, state)
+        for w in self.children:
+            w.draw(target)
+
+    def draw_static(self, target):
+        super().draw(target)
+        for w in self.children:
+            if not w.dynamic:
+                w.draw(target, NORMAL)
+
+    def draw_dynamic(self, target, area):
+        for w in self.children:
+            if (w.dynamic or w.state != NORMAL) and w.visible and w.rect.colliderect(area):
+                w.draw(target)
@@ -1,35 +1,90 @@
-from pgzero.loaders import images as pgz_images
+from ..systems.assets import assets
+from ..systems.timers import timers
 
-class Animation:
-    def __init__(self, frame_names, fps=8):
-        self.frames = [pgz_images.load(name) for name in frame_names]
+_CLIPS = {}
+
+
+class AnimationClip:
+    __slots__ = ("names", "frames", "fps")
+
+    def __init__(self, names, fps):
+        self.names = names
+        self.frames = tuple(assets.image(name) for name in names)
         self.fps = fps
-        self.t = 0.0
-        self.i = 0
-
-    def update(self, dt, playing=True):
-        if not playing or len(self.frames) <= 1:
-            return
-        self.t += dt
-        step = 1.0 / max(1, self.fps)
-        while self.t >= step:
-            self.t -= step
-            self.i = (self.i + 1) % len(self.frames)
+
+
+def clip(frame_names, fps=8):
+    key = (tuple(frame_names), fps)
+    c = _CLIPS.get(key)
+    if c is None:
+        c = _CLIPS[key] = AnimationClip(key[0], fps)
+    return c
+
+
+class _Playhead:
+    __slots__ = ("clip", "start", "held")
+
+    def __init__(self, clip):
+        self.clip = clip
+        self.start = timers.now
+        self.held = None
+
+    @property
+    def i(self):
+        return self.frame() % len(self.clip.frames)
+
+    def frame(self):
+        if self.held is not None:
+            return self.held
+        return int((timers.now - self.start) * self.clip.fps)
+
+    def frame_count(self):
+        return len(self.clip.frames)
+
+    def reset(self):
+        self.start = timers.now
+        self.held = None
+
+    def hold(self, i=0):
+        self.held = i
+
+    def set_playing(self, playing):
+        if playing:
+            if self.held is not None:
+                self.start = timers.now - self.held / max(1, self.clip.fps)
+                self.held = None
+        elif self.held is None:
+            self.held = self.frame()
 
     def get(self):
-        return self.frames[self.i]
+        frames = self.clip.frames
+        return frames[self.frame() % len(frames)]
+
+
+class Animation(_Playhead):
+    __slots__ = ()
+
+    def __init__(self, frames, fps=8):
+        super().__init__(frames if isinstance(frames, AnimationClip) else clip(frames, fps))
+
+    @property
+    def frames(self):
+        return self.clip.frames
 
-class DirectionalAnimation:
-    def __init__(self, anims, default_dir="down"):
-        self.anims = anims
+    @property
+    def fps(self):
+        return self.clip.fps
+
+
+class DirectionalAnimation(_Playhead):
+    __slots__ = ("clips", "dir")
+
+    def __init__(self, clips, default_dir="down"):
+        super().__init__(clips[default_dir])
+        self.clips = clips
         self.dir = default_dir
 
     def set_dir(self, d):
-        if d in self.anims:
+        if d in self.clips:
             self.dir = d
-
-    def update(self, dt, moving):
-        self.anims[self.dir].update(dt, playing=moving)
-
-    def get(self):
-        return self.anims[self.dir].get()
+            self.clip = self.clips[d]
@@ -0,0 +1,49 @@
+import random
+
+import pytest
+from pygame import Rect
+
+from base_game.level.fog import CHUNK, FogOfWar
+
+
+def _revealed(width, height, seed):
+    rng = random.Random(seed)
+    fog = FogOfWar(width, height)
+    for _ in range(12):
+        fog.reveal_radius(rng.randrange(width), rng.randrange(height), rng.randint(0, 6))
+    fog.reveal_rect(Rect(rng.randrange(width), rng.randrange(height), 9, 5))
+    return fog
+
+
+def _brute_counts(fog):
+    counts = bytearray(fog.cols * fog.rows)
+    for gy in range(fog.height):
+        for gx in range(fog.width):
+            if fog.explored(gx, gy):
+                counts[(gy // CHUNK) * fog.cols + gx // CHUNK] += 1
+    return counts
+
+
+@pytest.mark.parametrize("width,height", [(8, 8), (37, 23), (64, 40), (101, 9)])
+def test_round_trip(width, height):
+    fog = _revealed(width, height, width * height)
+    restored = FogOfWar.from_bytes(fog.to_bytes())
+    assert (restored.width, restored.height) == (width, height)
+    assert restored.bits == fog.bits
+    assert restored._counts == fog._counts == _brute_counts(fog)
+
+
+def test_full_reveal_counts_capacity():
+    fog = FogOfWar(19, 13)
+    fog.reveal_rect(Rect(0, 0, 19, 13))
+    restored = FogOfWar.from_bytes(fog.to_bytes())
+    for cy in range(restored.rows):
+        for cx in range(restored.cols):
+            assert restored._counts[cy * restored.cols + cx] == restored._capacity(cx, cy)
+
+
+def test_rejects_foreign_blob():
+    data = bytearray(FogOfWar(8, 8).to_bytes())
+    data[:4] = b"NOPE"
+    with pytest.raises(ValueError):
+        FogOfWar.from_bytes(bytes(data))